@@ -0,0 +1,298 @@
+"""Headless benchmark of CountdownGui.
+
+Runs the real CountdownGui on a virtual X server and measures:
+
+- time to first paint: from creating the window until its big-number
+  canvas is first exposed;
+- play() latency: the time for play() plus the redraw it causes;
+- the frame timing of create_random_bignum: the duration of the roll
+  against the intended one, the frames shown and dropped, and the time
+  spent in and between frames;
+- the time to show and redraw one Big Number;
+- the time to build a large form, with and without a batched layout;
+- the time to push fast-changing data into many number fields and
+  redraw them, with every update written right away and coalesced;
+- memory growth over many rounds (play, roll and solution search);
+- the time to import breezypythongui in a fresh interpreter.
+
+If DISPLAY is not set, an Xvfb server is started for the duration of
+the run. The results are written as JSON, so they can be compared
+between runs:
+
+    python benchmark.py [--rounds 10000] [--output bench_results.json]
+"""
+import argparse
+import contextlib
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import subprocess
+import sys
+import time
+import tkinter
+import tracemalloc
+
+import main
+from breezypythongui import EasyFrame
+from main import CountdownGui
+
+
+def start_xvfb(display=':99'):
+    """Starts an Xvfb server on {display}, points DISPLAY at it and
+    returns the process. Returns None if DISPLAY is already set."""
+    if os.environ.get('DISPLAY'):
+        return None
+    if not shutil.which('Xvfb'):
+        sys.exit('DISPLAY is not set and Xvfb is not installed')
+
+    process = subprocess.Popen(['Xvfb', display, '-screen', '0', '1024x768x24', '-nolisten', 'tcp'],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    os.environ['DISPLAY'] = display
+    # Wait until the server accepts connections
+    for _ in range(100):
+        try:
+            tkinter.Tk().destroy()
+            return process
+        except tkinter.TclError:
+            time.sleep(0.05)
+    process.terminate()
+    sys.exit(f'Xvfb did not start on {display}')
+
+
+def summarize(samples):
+    """Returns the usual statistics of a list of durations in seconds,
+    converted to milliseconds."""
+    samples = sorted(samples)
+    return {
+        'count': len(samples),
+        'min_ms': samples[0] * 1000,
+        'median_ms': statistics.median(samples) * 1000,
+        'mean_ms': statistics.fmean(samples) * 1000,
+        'p95_ms': samples[int(0.95 * (len(samples) - 1))] * 1000,
+        'max_ms': samples[-1] * 1000,
+        'stdev_ms': statistics.pstdev(samples) * 1000,
+    }
+
+
+def rss_bytes():
+    """Returns the resident set size of this process."""
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+def wait_until(gui, condition, timeout=30.0):
+    """Runs the event loop until {condition}() is true."""
+    deadline = time.perf_counter() + timeout
+    while not condition():
+        if time.perf_counter() > deadline:
+            raise TimeoutError('The GUI did not get there in time')
+        gui.update()
+
+
+def bench_import(count=20):
+    """Measures the time to import breezypythongui in a fresh
+    interpreter, as reported by python -X importtime."""
+    samples = []
+    for _ in range(count):
+        output = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import breezypythongui'],
+                                capture_output=True, text=True, check=True).stderr
+        for line in output.splitlines():
+            if line.rstrip().endswith('| breezypythongui'):
+                samples.append(int(line.split('|')[1]) / 1e6)
+    return summarize(samples)
+
+
+def bench_first_paint():
+    """Measures the time from creating CountdownGui until its
+    big-number canvas has been exposed."""
+    exposed = []
+    start = time.perf_counter()
+    gui = CountdownGui()
+    gui.canvas.bind('<Expose>', lambda event: exposed.append(time.perf_counter()), add='+')
+    wait_until(gui, lambda: exposed)
+    return gui, exposed[0] - start
+
+
+def bench_play(gui, count=200):
+    """Measures play() and the redraw it causes."""
+    samples = []
+    for _ in range(count):
+        start = time.perf_counter()
+        gui.play()
+        gui.update_idletasks()
+        samples.append(time.perf_counter() - start)
+    return summarize(samples)
+
+
+def bench_roll(gui, rolls=5):
+    """Measures the rolls of create_random_bignum with the frame
+    statistics of the roll animation: the duration of each roll and
+    how far it is from the intended one, the frames shown and dropped,
+    the time spent drawing a frame and the interval between frames."""
+    durations, errors, frames, dropped, frame_times, intervals = [], [], [], [], [], []
+    animation = gui.roll_animation
+    for _ in range(rolls):
+        gui.play()
+        gui.create_random_bignum()
+        wait_until(gui, lambda: not gui.is_rolling())
+        durations.append(animation.elapsed)
+        errors.append(abs(animation.elapsed - animation.duration / 1000))
+        frames.append(animation.frames)
+        dropped.append(animation.dropped)
+        frame_times.extend(animation.frameTimes)
+        intervals.extend(animation.intervals)
+    return {
+        'intended_duration_ms': animation.duration,
+        'frames_per_roll': statistics.fmean(frames),
+        'dropped_per_roll': statistics.fmean(dropped),
+        'duration': summarize(durations),
+        'duration_error': summarize(errors),
+        'frame_time': summarize(frame_times),
+        'interval': summarize(intervals),
+    }
+
+
+class NoDelayGui(CountdownGui):
+    """A CountdownGui that rolls without delays, to play many rounds."""
+    ROLL_DURATION = 0
+
+
+def bench_digits(frames=500):
+    """Measures show_bignum and the redraw it causes: the work of one
+    frame of the roll."""
+    gui = NoDelayGui()
+    gui.update()
+    rng = random.Random(0)
+    samples = []
+    for _ in range(frames):
+        number = str(rng.randint(100, 999))
+        start = time.perf_counter()
+        gui.show_bignum(number)
+        gui.update_idletasks()
+        samples.append(time.perf_counter() - start)
+    gui.master.destroy()
+    return summarize(samples)
+
+
+def bench_layout(rows=100, count=5):
+    """Measures building a form of {rows} rows of a label and a text
+    field, until it is laid out, with every widget placed right away
+    and with the placements batched by EasyFrame.layout."""
+    results = {}
+    for batched in (False, True):
+        samples = []
+        for _ in range(count):
+            start = time.perf_counter()
+            frame = EasyFrame(title='Form')
+            with frame.layout() if batched else contextlib.nullcontext():
+                for row in range(rows):
+                    frame.addLabel(f'Field {row}', row=row, column=0)
+                    frame.addTextField('', row=row, column=1)
+            frame.update_idletasks()
+            samples.append(time.perf_counter() - start)
+            frame.master.destroy()
+        results['batched' if batched else 'immediate'] = summarize(samples)
+    return results
+
+
+def bench_fields(fields=300, updates=20, ticks=20):
+    """Measures updating {fields} integer fields {updates} times each
+    between two redraws, for {ticks} redraws, with every update written
+    to Tk right away and with the updates coalesced."""
+    results = {}
+    for coalesce in (False, True):
+        frame = EasyFrame(title='Fields')
+        with frame.layout():
+            widgets = [frame.addIntegerField(0, row=n // 10, column=n % 10, width=6)
+                       for n in range(fields)]
+        for field in widgets:
+            field.setCoalesced(coalesce)
+        frame.update()
+        samples = []
+        for tick in range(ticks):
+            start = time.perf_counter()
+            for update in range(updates):
+                for field in widgets:
+                    field.setNumber(tick * updates + update)
+            frame.update_idletasks()
+            samples.append(time.perf_counter() - start)
+        frame.master.destroy()
+        results['coalesced' if coalesce else 'immediate'] = summarize(samples)
+    return results
+
+
+def bench_memory(rounds):
+    """Plays {rounds} rounds (play, roll and solution search) and
+    measures how much the memory use grows."""
+    gui = NoDelayGui()
+    gui.update()
+    # Warm up the caches before taking the baseline
+    for _ in range(10):
+        gui.play()
+        gui.create_random_bignum()
+        wait_until(gui, lambda: not gui.is_rolling())
+
+    tracemalloc.start()
+    rss_before = rss_bytes()
+    python_before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        gui.play()
+        gui.create_random_bignum()
+        wait_until(gui, lambda: not gui.is_rolling())
+    elapsed = time.perf_counter() - start
+    python_after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    rss_after = rss_bytes()
+    gui.master.destroy()
+    return {
+        'rounds': rounds,
+        'seconds': elapsed,
+        'rss_growth_bytes': rss_after - rss_before,
+        'python_growth_bytes': python_after - python_before,
+        'python_growth_bytes_per_round': (python_after - python_before) / rounds,
+    }
+
+
+def run():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--rounds', type=int, default=10000,
+                        help='the number of rounds for the memory benchmark')
+    parser.add_argument('--output', default='bench_results.json',
+                        help='the file to write the results to')
+    args = parser.parse_args()
+
+    # The solver logs every round
+    main.logger.setLevel('WARNING')
+    import_time = bench_import()
+    xvfb = start_xvfb()
+    try:
+        gui, first_paint = bench_first_paint()
+        results = {
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'tk': tkinter.TkVersion,
+            'import': import_time,
+            'first_paint_ms': first_paint * 1000,
+            'play': bench_play(gui),
+            'roll': bench_roll(gui),
+        }
+        gui.master.destroy()
+        results['digits'] = bench_digits()
+        results['layout'] = bench_layout()
+        results['fields'] = bench_fields()
+        results['memory'] = bench_memory(args.rounds)
+    finally:
+        if xvfb:
+            xvfb.terminate()
+
+    with open(args.output, 'w') as f:
+        json.dump(results, f, indent=2)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,513 @@
+"""
+File: breezydialogs.py
+Version: 1.0
+Copyright 2012 by Ken Lambert
+
+Dialog classes for breezypythongui.
+
+LICENSE: This is open-source software released under the terms of the
+GPL (http://www.gnu.org/licenses/gpl.html).
+
+This module is imported by breezypythongui the first time a dialog is
+used, so that programs without dialogs do not pay for importing
+tkinter.simpledialog.  Import the classes from breezypythongui as usual.
+
+The message and prompter boxes of EasyFrame are taken from a DialogPool:
+when closed they are hidden instead of destroyed, and the next box of
+the same kind for the same window reuses them.
+
+"""
+
+import collections
+import tkinter
+import tkinter.simpledialog
+
+from breezypythongui import N, S, E, W, NONE, WORD, VERTICAL, HORIZONTAL, \
+     NORMAL, DISABLED, ACTIVE, FloatField, IntegerField, TextField, TextArea, \
+     EasyListbox, VirtualListbox, EasyRadiobuttonGroup, EasyCheckbutton, \
+     EasyMenuBar, EasyCanvas, EasyPanel
+
+# Support classes for dialogs.
+
+class _Reusable(object):
+    """Lets a dialog be hidden when it is closed, and shown again with
+    new contents, instead of being destroyed and built again.  A
+    reusable dialog must be created with pooled = True."""
+
+    _pooled = False
+
+    def _startPooled(self, parent):
+        """Call before Dialog.__init__ to make the dialog reusable."""
+        self._pooled = True
+        # Written with False when the dialog is closed
+        self._visible = tkinter.BooleanVar(parent, True)
+
+    def wait_window(self, window = None):
+        """Waits until the dialog is closed.  A reusable dialog is only
+        hidden, so this waits for that instead of its destruction."""
+        if self._pooled and window in (None, self):
+            self.wait_variable(self._visible)
+        else:
+            tkinter.simpledialog.Dialog.wait_window(self, window)
+
+    def destroy(self):
+        """Destroys the dialog.  If it is being shown, the wait for it
+        to close ends."""
+        if self._pooled:
+            self._visible.set(False)
+        tkinter.simpledialog.Dialog.destroy(self)
+
+    def cancel(self, event = None):
+        """Closes the dialog: hides a reusable one, or destroys it."""
+        if not self._pooled:
+            tkinter.simpledialog.Dialog.cancel(self, event)
+            return
+        if self.parent is not None:
+            self.parent.focus_set()
+        self.grab_release()
+        self.withdraw()
+        self._visible.set(False)
+
+    def _show(self):
+        """Shows a hidden reusable dialog again, and waits until it is
+        closed, like the first time."""
+        self._modified = False
+        self._visible.set(True)
+        self.deiconify()
+        self.initial_focus.focus_set()
+        self.wait_visibility()
+        self.grab_set()
+        self.wait_window(self)
+
+
+class MessageBox(_Reusable, tkinter.simpledialog.Dialog):
+    """Represents a message dialog with a scrollable text area."""
+
+    @classmethod
+    def message(cls, title = "", message = "", width = 25, height = 5):
+        MessageBox(tkinter.Frame(), title, message, width, height)
+
+    def __init__(self, parent, title, message, width, height, pooled = False):
+        """Set up the window and widgets.  If pooled is True, the
+        dialog is hidden when closed, and can be shown again with
+        reuse."""
+        self._message = message
+        self._width = width
+        self._height = height
+        self._modified = False
+        if pooled:
+            self._startPooled(parent)
+        tkinter.simpledialog.Dialog.__init__(self, parent, title)
+
+    def reuse(self, title, message, width, height):
+        """Shows a hidden pooled message box again with the given
+        title, message, width and height."""
+        self.title(title)
+        self._output["state"] = NORMAL
+        self._output.configure(width = width, height = height)
+        self._output.delete("1.0", "end")
+        self._output.insert("1.0", message)
+        self._output["state"] = DISABLED
+        self._show()
+
+    def body(self, master):
+        self.resizable(0, 0)
+        yScroll = tkinter.Scrollbar(master, orient = VERTICAL)
+        yScroll.grid(row = 0, column = 1, sticky = N+S)
+        output = tkinter.Text(master, width = self._width, height = self._height,
+                      padx = 5, pady = 5, wrap = WORD,
+                      yscrollcommand = yScroll.set)
+        output.grid(row = 0, column = 0, sticky = N+W+S+E)
+        output.insert("1.0", self._message)
+        output["state"] = DISABLED
+        yScroll["command"] = output.yview
+        self._output = output
+        return output
+
+    def buttonbox(self):
+        '''add standard button box.
+        override if you do not want the standard buttons'''
+        box = tkinter.Frame(self)
+        w = tkinter.Button(box, text="OK", width = 10,
+                           command = self.ok, default = ACTIVE)
+        w.pack()
+        self.bind("<Return>", self.ok)
+        box.pack()
+
+    def apply(self):
+        """Quits the dialog."""
+        self._modified = True
+
+    def modified(self):
+        return self._modified
+
+class PrompterBox(_Reusable, tkinter.simpledialog.Dialog):
+    """Represents an input dialog with a text field."""
+
+    @classmethod
+    def prompt(cls, title = "", promptString = "", inputText = "", fieldWidth = 20):
+        """Creates and pops up an input dialog."""
+        dlg = PrompterBox(tkinter.Frame(), title, promptString, inputText, fieldWidth)
+        return dlg.getText()
+
+    def __init__(self, parent, title, promptString, inputText, fieldWidth,
+                 pooled = False):
+        """Set up the window and widgets.  If pooled is True, the
+        dialog is hidden when closed, and can be shown again with
+        reuse."""
+        self._prompt = promptString
+        self._text = inputText
+        self._width = fieldWidth
+        self._modified = False
+        if pooled:
+            self._startPooled(parent)
+        tkinter.simpledialog.Dialog.__init__(self, parent, title)
+
+    def reuse(self, title, promptString, inputText, fieldWidth):
+        """Shows a hidden pooled prompter box again with the given
+        title, prompt, input text and field width."""
+        self.title(title)
+        self._label["text"] = promptString
+        self._field["width"] = fieldWidth
+        self._field.setText(inputText)
+        self._show()
+
+    def body(self, master):
+        self.resizable(0, 0)
+        label = tkinter.Label(master, text = self._prompt)
+        label.grid(row = 0, column = 0, padx = 5, sticky = N+W+S+E)
+        self._label = label
+        self._field = TextField(master, self._text, self._width, NORMAL)
+        self._field.grid(row = 1, column = 0, padx = 5, sticky = N+W+S+E)
+        return self._field
+
+    def buttonbox(self):
+        '''add standard button box.
+        override if you do not want the standard buttons'''
+        box = tkinter.Frame(self)
+        w = tkinter.Button(box, text="OK", width = 10,
+                           command = self.ok, default = ACTIVE)
+        w.pack()
+        self.bind("<Return>", self.ok)
+        box.pack()
+
+    def apply(self):
+        """Quits the dialog."""
+        self._modified = True
+
+    def modified(self):
+        return self._modified
+
+    def getText(self):
+        """Returns the text currently in the text field."""
+        return self._field.getText()
+
+class DialogPool(object):
+    """Keeps the message and prompter boxes that have been closed, to
+    show them again instead of building new ones.  A box is reused for
+    the same kind of box on the same window.  At most size boxes are
+    kept; the one that has been unused the longest is destroyed when
+    there are more.  A box that is destroyed, for example with its
+    window, leaves the pool right away."""
+
+    _shared = None
+
+    @classmethod
+    def shared(cls):
+        """Returns the pool used by EasyFrame.messageBox and
+        prompterBox."""
+        if cls._shared is None:
+            cls._shared = DialogPool()
+        return cls._shared
+
+    def __init__(self, size = 4):
+        self.size = size
+        # Hidden dialogs by (class, parent), least recently used first
+        self._idle = collections.OrderedDict()
+
+    def messageBox(self, parent, title = "", message = "", width = 25, height = 5):
+        """Pops up a message box on parent, and returns True if it was
+        closed with OK."""
+        dlg = self._take(MessageBox, parent)
+        if dlg is None:
+            dlg = MessageBox(parent, title, message, width, height, pooled = True)
+            self._watch(dlg)
+        else:
+            dlg.reuse(title, message, width, height)
+        self._give(dlg)
+        return dlg.modified()
+
+    def prompterBox(self, parent, title = "", promptString = "", inputText = "",
+                    fieldWidth = 20):
+        """Pops up a prompter box on parent, and returns the text
+        entered at the prompt."""
+        dlg = self._take(PrompterBox, parent)
+        if dlg is None:
+            dlg = PrompterBox(parent, title, promptString, inputText, fieldWidth,
+                              pooled = True)
+            self._watch(dlg)
+        else:
+            dlg.reuse(title, promptString, inputText, fieldWidth)
+        self._give(dlg)
+        return dlg.getText()
+
+    def clear(self):
+        """Destroys all the dialogs in the pool."""
+        while self._idle:
+            self._destroy(self._idle.popitem()[1])
+
+    def _take(self, cls, parent):
+        """Removes a hidden dialog from the pool and returns it, or
+        returns None if there is none that can be shown."""
+        dlg = self._idle.pop((cls, parent), None)
+        if dlg is not None and not self._exists(dlg):
+            dlg = None
+        return dlg
+
+    def _give(self, dlg):
+        """Puts a closed dialog in the pool."""
+        if not self._exists(dlg):
+            return
+        key = (type(dlg), dlg.parent)
+        # A box opened while another one was shown replaces it
+        previous = self._idle.pop(key, None)
+        if previous is not None:
+            self._destroy(previous)
+        self._idle[key] = dlg
+        while len(self._idle) > self.size:
+            self._destroy(self._idle.popitem(last = False)[1])
+
+    def _watch(self, dlg):
+        """Makes the pool forget dlg as soon as it is destroyed, for
+        example with its parent, so that it does not keep it alive."""
+        if self._exists(dlg):
+            dlg.bind("<Destroy>", lambda event: self._forget(dlg, event),
+                     add = "+")
+
+    def _forget(self, dlg, event):
+        # The binding also fires for the widgets in the dialog
+        if str(event.widget) != str(dlg):
+            return
+        key = (type(dlg), dlg.parent)
+        if self._idle.get(key) is dlg:
+            del self._idle[key]
+
+    @staticmethod
+    def _exists(dlg):
+        try:
+            return bool(dlg.winfo_exists())
+        except tkinter.TclError:
+            return False
+
+    def _destroy(self, dlg):
+        if self._exists(dlg):
+            dlg.destroy()
+
+
+class EasyDialog(tkinter.simpledialog.Dialog):
+    """Represents a general-purpose dialog.  Subclasses should include
+    body and apply methods."""
+
+    def __init__(self, parent, title = ""):
+        """Set up the window and widgets."""
+        self._modified = False
+        tkinter.simpledialog.Dialog.__init__(self, parent, title)
+
+    def modified(self):
+        """Returns the modified status of the dialog."""
+        return self._modified
+
+    def setModified(self):
+        self._modified = True
+
+    def addLabel(self, master, text, row, column,
+                 columnspan = 1, rowspan = 1,
+                 sticky = N+W, font = None):
+        """Creates and inserts a label at the row and column,
+        and returns the label."""
+        label = tkinter.Label(master, text = text, font = font)
+        master.rowconfigure(row, weight = 1)
+        master.columnconfigure(column, weight = 1)
+        label.grid(row = row, column = column,
+                   columnspan = columnspan, rowspan = rowspan,
+                   padx = 5, pady = 5, sticky = sticky)
+        return label
+
+    def addButton(self, master, text, row, column,
+                  columnspan = 1, rowspan = 1,
+                  command = lambda: None,
+                  state = NORMAL):
+        """Creates and inserts a button at the row and column,
+        and returns the button."""
+        button = tkinter.Button(master, text = text,
+                                command = command, state = state)
+        master.rowconfigure(row, weight = 1)
+        master.columnconfigure(column, weight = 1)
+        button.grid(row = row, column = column,
+                    columnspan = columnspan, rowspan = rowspan,
+                    padx = 5, pady = 5)
+        return button
+
+    def addFloatField(self, master, value, row, column,
+                      columnspan = 1, rowspan = 1,
+                      width = 20, precision = None,
+                      sticky = N+E, state = NORMAL):
+        """Creates and inserts a float field at the row and column,
+        and returns the float field."""
+        field = FloatField(master, value, width, precision, state)
+        master.rowconfigure(row, weight = 1)
+        master.columnconfigure(column, weight = 1)
+        field.grid(row = row, column = column,
+                   columnspan = columnspan, rowspan = rowspan,
+                   padx = 5, pady = 5, sticky = sticky)
+        return field
+
+    def addIntegerField(self, master, value, row, column,
+                        columnspan = 1, rowspan = 1,
+                        width = 10, sticky = N+E, state = NORMAL):
+        """Creates and inserts an integer field at the row and column,
+        and returns the integer field."""
+        field = IntegerField(master, value, width, state)
+        master.rowconfigure(row, weight = 1)
+        master.columnconfigure(column, weight = 1)
+        field.grid(row = row, column = column,
+                   columnspan = columnspan, rowspan = rowspan,
+                   padx = 5, pady = 5, sticky = sticky)
+        return field
+
+    def addTextField(self, master, text, row, column,
+                     columnspan = 1, rowspan = 1,
+                     width = 20, sticky = N+E, state = NORMAL):
+        """Creates and inserts a text field at the row and column,
+        and returns the text field."""
+        field = TextField(master, text, width, state)
+        master.rowconfigure(row, weight = 1)
+        master.columnconfigure(column, weight = 1)
+        field.grid(row = row, column = column,
+                   columnspan = columnspan, rowspan = rowspan,
+                   padx = 5, pady = 5, sticky = sticky)
+        return field
+
+    def addCheckbutton(self, master, text, row, column,
+                       rowspan = 1, columnspan = 1,
+                       sticky = N+S+E+W, command = lambda : 0):
+        """Creates and inserts check button at the row and column,
+        and returns the check button."""
+        cb = EasyCheckbutton(master, text, command)
+        master.rowconfigure(row, weight = 1)
+        master.columnconfigure(column, weight = 1)
+        cb.grid(row = row, column = column,
+                columnspan = columnspan, rowspan = rowspan,
+                   padx = 5, pady = 5, sticky = sticky)
+        return cb
+
+    def addRadiobuttonGroup(self, master, row, column,
+                            rowspan = 1, columnspan = 1, orient = VERTICAL):
+        """Creates and returns a radio button group."""
+        return EasyRadiobuttonGroup(master, row, column, rowspan, columnspan, orient)
+
+    def addScale(self, master, row, column, rowspan = 1, columnspan = 1,
+                 command = lambda value: value, from_ = 0, to = 0,
+                 label = "", length = 100, orient = HORIZONTAL,
+                 resolution = 1, tickinterval = 0):
+        """Creates and inserts a scale at the row and column,
+        and returns the scale."""
+        scale = tkinter.Scale(master, command = command, from_ = from_, to = to,
+                              label = label, length = length,
+                              orient = orient, resolution = resolution,
+                              tickinterval = tickinterval, relief = "sunken",
+                              borderwidth = 4)
+        master.rowconfigure(row, weight = 1)
+        master.columnconfigure(column, weight = 1)
+        scale.grid(row = row, column = column, columnspan = columnspan,
+                   rowspan = rowspan, sticky = N+S+E+W)
+        return scale
+
+    def addTextArea(self, master, text, row, column, rowspan = 1, columnspan = 1,
+                    width = 80, height = 5, wrap = NONE):
+        """Creates and inserts a multiline text area at the row and column,
+        and returns the text area.  Vertical and horizontal scrollbars are
+        provided."""
+        frame = tkinter.Frame(master)
+        frame.grid(row = row, column = column,
+                   columnspan = columnspan, rowspan = rowspan,
+                   sticky = N+S+E+W)
+        master.columnconfigure(column, weight = 1)
+        master.rowconfigure(row, weight = 1)
+        xScroll = tkinter.Scrollbar(frame, orient = HORIZONTAL)
+        xScroll.grid(row = 1, column = 0, sticky = E+W)
+        yScroll = tkinter.Scrollbar(frame, orient = VERTICAL)
+        yScroll.grid(row = 0, column = 1, sticky = N+S)
+        area = TextArea(frame, text, width, height,
+                        xScroll.set, yScroll.set, wrap)
+        area.grid(row = 0, column = 0,
+                  padx = 5, pady = 5, sticky = N+S+E+W)
+        frame.columnconfigure(0, weight = 1)
+        frame.rowconfigure(0, weight = 1)
+        xScroll["command"] = area.xview
+        yScroll["command"] = area.yview
+        return area
+
+    def addListbox(self, master, row, column, rowspan = 1, columnspan = 1,
+                   width = 10, height = 5, listItemSelected = lambda index: index,
+                   source = None, size = None):
+        """Creates and inserts a scrolling list box at the row and column, with a
+        width and height in lines and columns of text, and a default item selection
+        method, and returns the list box.  If a source is given (see
+        VirtualListbox.setSource), the list box only holds the rows in view.
+        A function source also needs the size."""
+        frame = tkinter.Frame(master)
+        frame.grid(row = row, column = column, columnspan = columnspan, rowspan = rowspan,
+                   sticky = N+S+E+W)
+        master.columnconfigure(column, weight = 1)
+        master.rowconfigure(row, weight = 1)
+        yScroll = tkinter.Scrollbar(frame, orient = VERTICAL)
+        yScroll.grid(row = 0, column = 1, sticky = N+S)
+        if source is None:
+            listBox = EasyListbox(frame, width, height, yScroll.set, listItemSelected)
+        else:
+            listBox = VirtualListbox(frame, width, height, yScroll.set,
+                                     listItemSelected, source, size)
+        listBox.grid(row = 0, column = 0, sticky = N+S+E+W)
+        frame.columnconfigure(0, weight = 1)
+        frame.rowconfigure(0, weight = 1)
+        yScroll["command"] = listBox.yview
+        return listBox
+
+    def addCanvas(self, master, canvas = None, row = 0, column = 0,
+                  rowspan = 1, columnspan = 1, width = 200, height = 100,
+                  background = "white"):
+        """Creates and inserts a canvas at the row and column,
+        and returns the canvas."""
+        if not canvas:
+            canvas = EasyCanvas(master, width = width, height = height,
+                                background = background)
+        canvas.grid(row = row, column = column,
+                    rowspan = rowspan, columnspan = columnspan,
+                    sticky = W+E+N+S)
+        master.columnconfigure(column, weight = 10)
+        master.rowconfigure(row, weight = 10)
+        return canvas
+
+    def addMenuBar(self, master, row, column, rowspan = 1, columnspan = 1,
+                   orient = "horizontal"):
+        """Creates and inserts a menu bar at the row and column,
+        and returns the menu bar."""
+        if not orient in ("horizontal", "vertical"):
+            raise ValueError("orient must be horizontal or vertical")
+        menuBar = EasyMenuBar(master, orient)
+        menuBar.grid(row = row, column = column,
+                     rowspan = rowspan, columnspan = columnspan,
+                     sticky = N+W)
+        return menuBar
+
+    def messageBox(self, title = "", message = "", width = 25, height = 5):
+        """Creates and pops up a message box, with the given title,
+        message, and width and height in rows and columns of text."""
+        return DialogPool.shared().messageBox(self, title, message, width, height)
+
+        # Added 12-18-2012
+    def addPanel(self, master, row, column,
+                 rowspan = 1, columnspan = 1, background = "white"):
+        """Creates and returns a panel."""
+        return EasyPanel(master, row, column, rowspan, columnspan, background)
@@ -13,12 +13,29 @@ written by Ken Lambert and Martin Osborne.
 PLATFORMS: The package is a wrapper around tkinter (Python 3.X) and should
 run on any platform where tkinter is available.
 
-INSTALLATION: Put this file where Python can see it.
+INSTALLATION: Put this file and breezydialogs.py where Python can see them.
+The dialog classes (MessageBox, PrompterBox, EasyDialog and DialogPool)
+live in breezydialogs.py and are only imported on first use.
+
+PROFILING: Set the environment variable BREEZYPYTHONGUI_PROFILE to a file
+name, or call enableProfiling before creating a window, to count and time
+the calls to Tcl by method and by event handler.  The totals are written
+to the file as JSON when the program exits.
 
 """
 
+import atexit
+import contextlib
+import array
+import functools
+import itertools
+import math
+import mmap
+import os
+import sys
+import time
 import tkinter
-import tkinter.simpledialog
+import types
 
 N = tkinter.N
 S = tkinter.S
@@ -36,7 +53,80 @@ RAISED = tkinter.RAISED
 SINGLE = tkinter.SINGLE
 ACTIVE = tkinter.ACTIVE
 
-class EasyFrame(tkinter.Frame):
+def _grid(widget, **options):
+    """Places widget in the grid of its parent with the given options,
+    or records the placement if the parent is collecting a layout."""
+    layout = getattr(widget.master, "_layout", None)
+    if layout is None:
+        widget.grid(**options)
+    else:
+        layout[2].append((widget, options))
+
+
+class _Layout(object):
+    """Lets a container (EasyFrame or EasyPanel) collect the placements
+    of its widgets and the weights of its rows and columns, and apply
+    them all at once.  See layout."""
+
+    # While collecting: (row weights, column weights, placements)
+    _layout = None
+
+    @contextlib.contextmanager
+    def layout(self):
+        """Collects the layout of the widgets added in a with block,
+        and sends it to Tk as one script when the block ends:
+
+            with frame.layout():
+                frame.addLabel(...)
+                frame.addButton(...)
+
+        Each row and column is configured once, with its last weight,
+        and the widgets are placed in the order they were added.  They
+        are not in the grid until the block ends, so grid_info and the
+        like do not work inside it.  A layout inside a layout joins
+        the outer one.  If the block raises an exception, nothing is
+        placed."""
+        if self._layout is not None:
+            yield
+            return
+        self._layout = (dict(), dict(), [])
+        try:
+            yield
+            rows, columns, placements = self._layout
+        finally:
+            self._layout = None
+        commands = []
+        for index, weight in rows.items():
+            commands.append(("grid", "rowconfigure", str(self), index, "-weight", weight))
+        for index, weight in columns.items():
+            commands.append(("grid", "columnconfigure", str(self), index, "-weight", weight))
+        for widget, options in placements:
+            command = ["grid", "configure", str(widget)]
+            for name, value in options.items():
+                command.extend(("-" + name.rstrip("_"), value))
+            commands.append(tuple(command))
+        if commands:
+            self.tk.call("apply", "commands {foreach c $commands {{*}$c}}",
+                         tuple(commands))
+
+    def rowconfigure(self, index, cnf = {}, **kw):
+        """Configures row index of the grid.  In a layout, setting the
+        weight is recorded instead."""
+        if self._layout is not None and not cnf and list(kw) == ["weight"]:
+            self._layout[0][index] = kw["weight"]
+        else:
+            return tkinter.Frame.rowconfigure(self, index, cnf, **kw)
+
+    def columnconfigure(self, index, cnf = {}, **kw):
+        """Configures column index of the grid.  In a layout, setting
+        the weight is recorded instead."""
+        if self._layout is not None and not cnf and list(kw) == ["weight"]:
+            self._layout[1][index] = kw["weight"]
+        else:
+            return tkinter.Frame.columnconfigure(self, index, cnf, **kw)
+
+
+class EasyFrame(_Layout, tkinter.Frame):
     """Represents an application window."""
 
     def __init__(self, title = "", width = None, height = None,
@@ -44,6 +134,8 @@ class EasyFrame(tkinter.Frame):
         """Will shrink wrap the window around the widgets if width
         and height are not provided."""
         tkinter.Frame.__init__(self, borderwidth = 4, relief = "sunken")
+        if _profiler:
+            _profiler.attach(self)
         if width and height:
             self.setSize(width, height)
         self.master.title(title)
@@ -87,9 +179,9 @@ class EasyFrame(tkinter.Frame):
                               foreground = foreground)
         self.rowconfigure(row, weight = 1)
         self.columnconfigure(column, weight = 1)
-        label.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
+        _grid(label, row = row, column = column,
+              columnspan = columnspan, rowspan = rowspan,
+              padx = 5, pady = 5, sticky = sticky)
         return label
 
     def addButton(self, text, row, column,
@@ -102,9 +194,9 @@ class EasyFrame(tkinter.Frame):
                                 command = command, state = state)
         self.rowconfigure(row, weight = 1)
         self.columnconfigure(column, weight = 1)
-        button.grid(row = row, column = column,
-                    columnspan = columnspan, rowspan = rowspan,
-                    padx = 5, pady = 5)
+        _grid(button, row = row, column = column,
+              columnspan = columnspan, rowspan = rowspan,
+              padx = 5, pady = 5)
         return button
 
     def addFloatField(self, value, row, column,
@@ -116,9 +208,9 @@ class EasyFrame(tkinter.Frame):
         field = FloatField(self, value, width, precision, state)
         self.rowconfigure(row, weight = 1)
         self.columnconfigure(column, weight = 1)
-        field.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
+        _grid(field, row = row, column = column,
+              columnspan = columnspan, rowspan = rowspan,
+              padx = 5, pady = 5, sticky = sticky)
         return field
 
     def addIntegerField(self, value, row, column,
@@ -129,9 +221,9 @@ class EasyFrame(tkinter.Frame):
         field = IntegerField(self, value, width, state)
         self.rowconfigure(row, weight = 1)
         self.columnconfigure(column, weight = 1)
-        field.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
+        _grid(field, row = row, column = column,
+              columnspan = columnspan, rowspan = rowspan,
+              padx = 5, pady = 5, sticky = sticky)
         return field
 
     def addTextField(self, text, row, column,
@@ -142,9 +234,9 @@ class EasyFrame(tkinter.Frame):
         field = TextField(self, text, width, state)
         self.rowconfigure(row, weight = 1)
         self.columnconfigure(column, weight = 1)
-        field.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
+        _grid(field, row = row, column = column,
+              columnspan = columnspan, rowspan = rowspan,
+              padx = 5, pady = 5, sticky = sticky)
         return field
 
     def addTextArea(self, text, row, column, rowspan = 1, columnspan = 1,
@@ -153,9 +245,9 @@ class EasyFrame(tkinter.Frame):
         and returns the text area.  Vertical and horizontal scrollbars are
         provided."""
         frame = tkinter.Frame(self)
-        frame.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   sticky = N+S+E+W)
+        _grid(frame, row = row, column = column,
+              columnspan = columnspan, rowspan = rowspan,
+              sticky = N+S+E+W)
         self.columnconfigure(column, weight = 1)
         self.rowconfigure(row, weight = 1)
         xScroll = tkinter.Scrollbar(frame, orient = HORIZONTAL)
@@ -173,18 +265,25 @@ class EasyFrame(tkinter.Frame):
         return area
 
     def addListbox(self, row, column, rowspan = 1, columnspan = 1,
-                   width = 10, height = 5, listItemSelected = lambda index: index):
+                   width = 10, height = 5, listItemSelected = lambda index: index,
+                   source = None, size = None):
         """Creates and inserts a scrolling list box at the row and column, with a
         width and height in lines and columns of text, and a default item selection
-        method, and returns the list box."""
+        method, and returns the list box.  If a source is given (see
+        VirtualListbox.setSource), the list box only holds the rows in view.
+        A function source also needs the size."""
         frame = tkinter.Frame(self)
-        frame.grid(row = row, column = column, columnspan = columnspan, rowspan = rowspan,
-                   sticky = N+S+E+W)
+        _grid(frame, row = row, column = column, columnspan = columnspan, rowspan = rowspan,
+              sticky = N+S+E+W)
         self.columnconfigure(column, weight = 1)
         self.rowconfigure(row, weight = 1)
         yScroll = tkinter.Scrollbar(frame, orient = VERTICAL)
         yScroll.grid(row = 0, column = 1, sticky = N+S)
-        listBox = EasyListbox(frame, width, height, yScroll.set, listItemSelected)
+        if source is None:
+            listBox = EasyListbox(frame, width, height, yScroll.set, listItemSelected)
+        else:
+            listBox = VirtualListbox(frame, width, height, yScroll.set,
+                                     listItemSelected, source, size)
         listBox.grid(row = 0, column = 0, sticky = N+S+E+W)
         frame.columnconfigure(0, weight = 1)
         frame.rowconfigure(0, weight = 1)
@@ -199,9 +298,9 @@ class EasyFrame(tkinter.Frame):
         if not canvas:
             canvas = EasyCanvas(self, width = width, height = height,
                                 background = background)
-        canvas.grid(row = row, column = column,
-                    rowspan = rowspan, columnspan = columnspan,
-                    sticky = W+E+N+S)
+        _grid(canvas, row = row, column = column,
+              rowspan = rowspan, columnspan = columnspan,
+              sticky = W+E+N+S)
         self.columnconfigure(column, weight = 10)
         self.rowconfigure(row, weight = 10)
         return canvas
@@ -219,8 +318,8 @@ class EasyFrame(tkinter.Frame):
                               borderwidth = 4)
         self.rowconfigure(row, weight = 1)
         self.columnconfigure(column, weight = 1)
-        scale.grid(row = row, column = column, columnspan = columnspan,
-                   rowspan = rowspan, sticky = N+S+E+W)
+        _grid(scale, row = row, column = column, columnspan = columnspan,
+              rowspan = rowspan, sticky = N+S+E+W)
         return scale
 
     def addMenuBar(self, row, column, rowspan = 1, columnspan = 1,
@@ -230,9 +329,9 @@ class EasyFrame(tkinter.Frame):
         if not orient in ("horizontal", "vertical"):
             raise ValueError("orient must be horizontal or vertical")
         menuBar = EasyMenuBar(self, orient)
-        menuBar.grid(row = row, column = column,
-                     rowspan = rowspan, columnspan = columnspan,
-                     sticky = N+W)
+        _grid(menuBar, row = row, column = column,
+              rowspan = rowspan, columnspan = columnspan,
+              sticky = N+W)
         return menuBar
 
     def addCheckbutton(self, text, row, column,
@@ -243,9 +342,9 @@ class EasyFrame(tkinter.Frame):
         cb = EasyCheckbutton(self, text, command)
         self.rowconfigure(row, weight = 1)
         self.columnconfigure(column, weight = 1)
-        cb.grid(row = row, column = column,
-                columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
+        _grid(cb, row = row, column = column,
+              columnspan = columnspan, rowspan = rowspan,
+              padx = 5, pady = 5, sticky = sticky)
         return cb
 
     def addRadiobuttonGroup(self, row, column,
@@ -264,8 +363,8 @@ class EasyFrame(tkinter.Frame):
     def messageBox(self, title = "", message = "", width = 25, height = 5):
         """Creates and pops up a message box, with the given title,
         message, and width and height in rows and columns of text."""
-        dlg = MessageBox(self, title, message, width, height)
-        return dlg.modified()
+        return _dialog("DialogPool").shared().messageBox(self, title, message,
+                                                         width, height)
 
     # Method to pop up a prompter box from this window.
 
@@ -273,28 +372,123 @@ class EasyFrame(tkinter.Frame):
         """Creates and pops up a prompter box, with the given title, prompt,
         input text, and field width in columns of text.
         Returns the text entered at the prompt."""
-        dlg = PrompterBox(self, title, promptString, inputText, fieldWidth)
-        return dlg.getText()
+        return _dialog("DialogPool").shared().prompterBox(self, title, promptString,
+                                                          inputText, fieldWidth)
 
 # Classes for easy widgets
 
+class _FieldUpdates(object):
+    """Holds the latest values given to coalescing fields, and writes
+    them to the fields' variables all at once, in a single Tcl call,
+    when the event loop of their root window is next idle."""
+
+    def __init__(self):
+        self._values = dict()
+        # The pending flush of each root window, by root
+        self._jobs = dict()
+        # The root windows that are watched for their destruction
+        self._roots = set()
+
+    def set(self, field, value):
+        """Records value as the latest value of field."""
+        self._values[field] = value
+        root = field._root()
+        if root not in self._jobs:
+            self._jobs[root] = root.after_idle(self.flush, root)
+            if root not in self._roots:
+                self._roots.add(root)
+                root.bind("<Destroy>",
+                          lambda event: self._destroyed(root, event),
+                          add = "+")
+
+    def get(self, field, default = None):
+        """Returns the value that is waiting to be written to field,
+        or default if there is none."""
+        return self._values.get(field, default)
+
+    def discard(self, field):
+        """Forgets the value that is waiting to be written to field."""
+        self._values.pop(field, None)
+
+    def flush(self, root):
+        """Writes the waiting values of the fields of root."""
+        self._jobs.pop(root, None)
+        pairs = []
+        for field in self._take(root):
+            pairs.extend((str(field.var), self._values.pop(field)))
+        if pairs:
+            root.tk.call("apply",
+                         "pairs {foreach {name value} $pairs {set ::$name $value}}",
+                         tuple(pairs))
+
+    def _take(self, root):
+        """Returns the fields of root that have a waiting value."""
+        return [field for field in self._values if field._root() is root]
+
+    def _destroyed(self, root, event):
+        """Forgets the pending flush and values of root when it is
+        destroyed, as Tk cancels the flush with it.  The binding also
+        fires for every child of root, which is ignored."""
+        if event.widget is not root:
+            return
+        self._jobs.pop(root, None)
+        self._roots.discard(root)
+        for field in self._take(root):
+            del self._values[field]
+
+_fieldUpdates = _FieldUpdates()
+_NOT_PENDING = object()
+
+
 class AbstractField(tkinter.Entry):
     """Represents common features of float fields, integer fields,
     and text fields."""
 
+    # Set to True on a class (or on a field, with setCoalesced) to
+    # coalesce the updates of its fields
+    coalesce = False
+
     def __init__(self, parent, value, width, state):
         self.var = tkinter.StringVar()
-        self.setValue(value)
+        self.var.set(value)
         tkinter.Entry.__init__(self, parent,
                                textvariable = self.var,
                                width = width, state = state)
 
+    def setCoalesced(self, coalesce = True):
+        """Turns coalescing of updates on or off.  When on, setValue only
+        records the value, and all fields that have changed are written
+        to Tk together when the event loop is next idle.  A field that
+        changes many times between two redraws is then written once.
+        getValue returns the latest value in either case."""
+        if not coalesce:
+            self._flush()
+        self.coalesce = coalesce
+
     def setValue(self, value):
-        self.var.set(value)
+        if self.coalesce:
+            _fieldUpdates.set(self, value)
+        else:
+            _fieldUpdates.discard(self)
+            self.var.set(value)
 
     def getValue(self):
+        value = _fieldUpdates.get(self, _NOT_PENDING)
+        if value is not _NOT_PENDING:
+            return str(value)
         return self.var.get()
 
+    def _flush(self):
+        """Writes a value that is waiting to be written right away."""
+        value = _fieldUpdates.get(self, _NOT_PENDING)
+        if value is not _NOT_PENDING:
+            _fieldUpdates.discard(self)
+            self.var.set(value)
+
+    def destroy(self):
+        _fieldUpdates.discard(self)
+        tkinter.Entry.destroy(self)
+
 
 class FloatField(AbstractField):
     """Represents a single line box for I/O of floats."""
@@ -350,9 +544,81 @@ class TextField(AbstractField):
         """Replaces the string contained in the field."""
         self.setValue(text)
 
-class TextArea(tkinter.Text):
+class _RowView(object):
+    """Scrolls through a long list of rows in a widget that holds only
+    the rows in view.  The class that uses it keeps the first row in
+    view in _top and the number of rows that fit in _rows, and provides
+    _rowCount(), and _showRows(), which keeps _top in range and puts
+    the rows in view in the widget."""
+
+    def _rowPadding(self):
+        """Returns the padding above and below the rows, in pixels."""
+        return 0
+
+    def _scrollBindings(self):
+        """Returns the (sequence, handler) pairs that scroll the rows
+        with the mouse wheel and fit them to the size of the widget."""
+        return [("<MouseWheel>", self._wheel),
+                ("<Button-4>", lambda event: self._scroll(-3)),
+                ("<Button-5>", lambda event: self._scroll(3)),
+                ("<Configure>", self._resized)]
+
+    def yview(self, *args):
+        """Scrolls the rows like tkinter's yview, for the scroll bar.
+        Without arguments, returns the fractions of the rows in view."""
+        size = self._rowCount()
+        if not args:
+            if size == 0:
+                return (0.0, 1.0)
+            return (self._top / size, min(self._top + self._rows, size) / size)
+        if args[0] == "moveto":
+            self._top = int(float(args[1]) * size)
+        elif args[0] == "scroll":
+            count = int(args[1])
+            if args[2] == "pages":
+                count *= self._rows
+            self._top += count
+        self._showRows()
+
+    def _scroll(self, count):
+        self._top += count
+        self._showRows()
+        return "break"
+
+    def _wheel(self, event):
+        if abs(event.delta) >= 120:
+            return self._scroll(-3 * (event.delta // 120))
+        return self._scroll(-event.delta)
+
+    def _resized(self, event):
+        """Fits the number of rows in view to the new height."""
+        border = 2 * (int(self["borderwidth"]) + int(self["highlightthickness"]) +
+                      self._rowPadding())
+        lineHeight = int(self.tk.call("font", "metrics", self["font"],
+                                      "-linespace"))
+        rows = max(1, (event.height - border) // lineHeight)
+        if rows != self._rows:
+            self._rows = rows
+            self._showRows()
+
+class TextArea(_RowView, tkinter.Text):
     """Represents a box for I/O of multiline text."""
 
+    # Inserts text at the end of the text area, drops the oldest lines
+    # beyond maxLines (if it is positive), and keeps the end in view if
+    # it was in view before, all in one call to Tcl.
+    _STREAM_SCRIPT = """{w text maxLines} {
+        set atEnd [expr {[lindex [$w yview] 1] >= 1.0}]
+        $w insert end $text
+        if {$maxLines > 0} {
+            set lines [expr {int([$w index end-1c]) - 1}]
+            if {$lines > $maxLines} {
+                $w delete 1.0 [expr {$lines - $maxLines + 1}].0
+            }
+        }
+        if {$atEnd} {$w see end}
+    }"""
+
     def __init__(self, parent, text, width, height,
                  xscrollcommand, yscrollcommand, wrap):
         tkinter.Text.__init__(self, parent,
@@ -361,27 +627,208 @@ class TextArea(tkinter.Text):
                               wrap = wrap,
                               xscrollcommand = xscrollcommand,
                               yscrollcommand = yscrollcommand)
+        self._streaming = False
+        self._maxLines = None
+        self._buffer = []
+        self._flushJob = None
+        # File viewer mode (see openFile)
+        self._yscrollcommand = yscrollcommand
+        self._file = None
         self.setText(text)
 
     def getText(self):
-        """Returns the string contained in the text area."""
+        """Returns the string contained in the text area.  In file
+        viewer mode, this is the whole file."""
+        if self._file is not None:
+            return self._file[:].decode(self._encoding, "replace")
+        self.flush()
         return self.get("1.0", END)
 
     def setText(self, text):
-        """Replaces the string contained in the text area."""
+        """Replaces the string contained in the text area.  This ends
+        file viewer mode."""
+        self.closeFile()
+        self._buffer = []
         self.delete("1.0", END)
         self.insert("1.0", text)
         
     def appendText(self, text):
         """Inserts the text after the string contained in
-        the text area."""
-        self.insert(END, text)
+        the text area.  In streaming mode, the text is
+        buffered until the application is idle."""
+        if self._file is not None:
+            raise ValueError("Cannot append to a text area showing a file")
+        if not self._streaming:
+            self.insert(END, text)
+            return
+        self._buffer.append(text)
+        if self._flushJob is None:
+            self._flushJob = self.after_idle(self.flush)
+
+    def setStreaming(self, streaming = True, maxLines = None):
+        """Turns streaming mode on or off.  In streaming mode, appendText
+        buffers the text, and all text appended since the last time
+        is inserted at once when the application is idle.  If maxLines
+        is given, only the last maxLines lines are kept, which makes
+        the text area suitable for a live log."""
+        if not streaming:
+            self.flush()
+        self._streaming = streaming
+        self._maxLines = maxLines
+
+    def flush(self):
+        """Inserts the buffered text of streaming mode now."""
+        if self._flushJob is not None:
+            self.after_cancel(self._flushJob)
+            self._flushJob = None
+        if not self._buffer:
+            return
+        text = "".join(self._buffer)
+        self._buffer = []
+        if self._maxLines and text.count("\n") > self._maxLines:
+            # Only the last lines can survive the trimming
+            text = "\n".join(text.split("\n")[-self._maxLines - 1:])
+        self.tk.call("apply", self._STREAM_SCRIPT, str(self), text,
+                     self._maxLines or 0)
+
+    # File viewer mode.  The file is memory-mapped, and only the lines
+    # in view are put in the widget.  The offset of every
+    # _LINE_STRIDE-th line is indexed when the file is opened; the
+    # lines in between are found from there.
+
+    _LINE_STRIDE = 64
+    _INDEX_CHUNK = 1 << 22
+
+    # Replaces the text of a disabled text widget in one call to Tcl
+    _VIEW_SCRIPT = """{w text} {
+        $w configure -state normal
+        $w delete 1.0 end
+        $w insert 1.0 $text
+        $w configure -state disabled
+    }"""
+
+    def openFile(self, path, encoding = "utf-8"):
+        """Shows the file with the given path, read-only.  The file is
+        memory-mapped, so that even very large files open quickly and
+        use little memory: only the lines in view are read."""
+        self.closeFile()
+        self.flush()
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                self._file = b""
+            else:
+                self._file = mmap.mmap(f.fileno(), 0, access = mmap.ACCESS_READ)
+        self._encoding = encoding
+        self._indexLines()
+        self._top = 0
+        self._rows = int(self["height"])
+        # The widget never scrolls vertically itself
+        self["yscrollcommand"] = ""
+        self._bindings = [(sequence, self.bind(sequence, handler))
+                          for sequence, handler in self._scrollBindings() + [
+            ("<Prior>", lambda event: self._scroll(-self._rows)),
+            ("<Next>", lambda event: self._scroll(self._rows))]]
+        self._showRows()
+
+    def closeFile(self):
+        """Ends file viewer mode, if the text area is in it."""
+        if self._file is None:
+            return
+        for sequence, funcid in self._bindings:
+            self.unbind(sequence, funcid)
+        if isinstance(self._file, mmap.mmap):
+            self._file.close()
+        self._file = self._lineStarts = None
+        self["yscrollcommand"] = self._yscrollcommand or ""
+        self["state"] = NORMAL
+
+    def lineCount(self):
+        """Returns the number of lines of the file in view."""
+        return self._lineCount
+
+    def _indexLines(self):
+        """Records the offset of every _LINE_STRIDE-th line.  Each chunk
+        of the file is split into lines in C, and the offsets are
+        computed without a Python loop over the lines."""
+        data = self._file
+        size = len(data)
+        stride = self._LINE_STRIDE
+        self._lineStarts = array.array("q")
+        lines = 0
+        position = 0
+        while position < size:
+            end = data.rfind(b"\n", position, position + self._INDEX_CHUNK)
+            if end == -1:
+                end = data.find(b"\n", position + self._INDEX_CHUNK)
+            if end == -1:
+                # The last line has no newline
+                if lines % stride == 0:
+                    self._lineStarts.append(position)
+                lines += 1
+                break
+            parts = data[position:end + 1].split(b"\n")
+            count = len(parts) - 1
+            starts = itertools.accumulate(map((1).__add__, map(len, parts)),
+                                          initial = position)
+            self._lineStarts.extend(
+                itertools.islice(starts, -lines % stride, count, stride))
+            lines += count
+            position = end + 1
+        self._lineCount = lines
+
+    def _lineOffset(self, line):
+        """Returns the offset of the start of the line."""
+        offset = self._lineStarts[line // self._LINE_STRIDE]
+        for _ in range(line % self._LINE_STRIDE):
+            offset = self._file.find(b"\n", offset) + 1
+        return offset
+
+    def _rowCount(self):
+        return self._lineCount
+
+    def _rowPadding(self):
+        return int(self["pady"])
+
+    def _showRows(self):
+        """Puts the lines in view in the widget."""
+        self._top = max(0, min(self._top, self._lineCount - self._rows))
+        last = min(self._top + self._rows + 1, self._lineCount)
+        if last > self._top:
+            start = self._lineOffset(self._top)
+            end = start
+            for _ in range(last - self._top):
+                end = self._file.find(b"\n", end) + 1 or len(self._file)
+            text = self._file[start:end].decode(self._encoding, "replace")
+        else:
+            text = ""
+        self.tk.call("apply", self._VIEW_SCRIPT, str(self), text)
+        if self._yscrollcommand:
+            self._yscrollcommand(*self.yview())
+
+    def yview(self, *args):
+        """Scrolls the text vertically, like tkinter's yview.  In file
+        viewer mode, this scrolls through the whole file."""
+        if self._file is None:
+            return tkinter.Text.yview(self, *args)
+        return _RowView.yview(self, *args)
+
+    def destroy(self):
+        if self._flushJob is not None:
+            self.after_cancel(self._flushJob)
+            self._flushJob = None
+        self.closeFile()
+        tkinter.Text.destroy(self)
 
 class EasyListbox(tkinter.Listbox):
-    """Represents a list box."""
+    """Represents a list box.  A copy of the items is kept in Python,
+    so that looking up an item or its index needs no calls to Tk."""
 
     def __init__(self, parent, width, height, yscrollcommand, listItemSelected):
         self._listItemSelected = listItemSelected
+        # The items as strings, and the index of the first occurrence
+        # of each item (rebuilt when it is None)
+        self._items = []
+        self._firstIndex = dict()
         tkinter.Listbox.__init__(self, parent,
                                  width = width, height = height,
                                  yscrollcommand = yscrollcommand,
@@ -413,36 +860,222 @@ class EasyListbox(tkinter.Listbox):
         if index == -1:
             return ""
         else:
-            return self.get(index)
+            return self._items[index]
 
     def setSelectedIndex(self, index):
         """Selects the item at the index if it's in the range."""
-        if index < 0 or index >= self.size(): return
+        if index < 0 or index >= len(self._items): return
         self.selection_set(index, index)
 
+    def setItems(self, items):
+        """Replaces all items in the list box with items, in a single
+        call to Tk."""
+        items = [self._asString(item) for item in items]
+        self.tk.call("apply", "{w items} {$w delete 0 end; $w insert end {*}$items}",
+                     str(self), tuple(items))
+        self._items = items
+        self._firstIndex = None
+
+    def extend(self, items):
+        """Adds items at the end of the list box, in a single call
+        to Tk."""
+        self.insert(END, *items)
+
     def clear(self):
-        """Deletes all items from the list box."""
-        while self.size() > 0:
-            self.delete(0)
+        """Deletes all items from the list box, in a single call
+        to Tk."""
+        self.delete(0, END)
 
     def getIndex(self, item):
         """Returns the index of item if it's in the list box,
         or -1 otherwise."""
-        tup = self.get(0, self.size() - 1)
-        if item in tup:
-            return tup.index(item)
+        if self._firstIndex is None:
+            self._firstIndex = dict()
+            for index, each in enumerate(self._items):
+                self._firstIndex.setdefault(each, index)
+        return self._firstIndex.get(item, -1)
+
+    # insert and delete keep the copy of the items up to date.  Adding
+    # at the end is cheap; other changes rebuild the index of the first
+    # occurrences on the next call of getIndex.
+
+    def insert(self, index, *elements):
+        """Inserts the elements before the index."""
+        # Tk puts items beyond either end at that end
+        position = max(0, min(self._position(index, len(self._items)),
+                              len(self._items)))
+        tkinter.Listbox.insert(self, index, *elements)
+        elements = [self._asString(element) for element in elements]
+        if position >= len(self._items):
+            if self._firstIndex is not None:
+                for offset, element in enumerate(elements):
+                    self._firstIndex.setdefault(element, position + offset)
+            self._items.extend(elements)
         else:
-            return -1
+            self._items[position:position] = elements
+            self._firstIndex = None
+
+    def delete(self, first, last = None):
+        """Deletes the items from first to last, inclusive."""
+        start = self._position(first, len(self._items) - 1)
+        if last is None:
+            stop = start
+        else:
+            stop = self._position(last, len(self._items) - 1)
+        tkinter.Listbox.delete(self, first, last)
+        if start <= stop:
+            del self._items[max(start, 0):stop + 1]
+            self._firstIndex = None if self._items else dict()
+
+    def _position(self, index, end):
+        """Returns index as a number; END stands for end."""
+        if isinstance(index, int):
+            return index
+        if index == END:
+            return end
+        return self.index(index)
+
+    @staticmethod
+    def _asString(item):
+        """Returns the item as Tk will show it."""
+        return item if isinstance(item, str) else str(item)
         
+class VirtualListbox(_RowView, EasyListbox):
+    """Represents a list box for very long lists.  The items come from a
+    Python sequence or function, and only the rows in view are put in
+    the widget; the others are fetched as the list is scrolled.  All
+    indexes, including the ones passed to listItemSelected, are
+    positions in the whole list."""
+
+    def __init__(self, parent, width, height, yscrollcommand,
+                 listItemSelected, source, size = None):
+        # The widget never scrolls itself, so it gets no scroll command
+        EasyListbox.__init__(self, parent, width, height, None,
+                             listItemSelected)
+        self._yscrollcommand = yscrollcommand
+        self._top = 0
+        self._rows = height
+        self._selected = -1
+        for sequence, handler in self._scrollBindings():
+            self.bind(sequence, handler)
+        self.bind("<Up>", lambda event: self._moveSelection(-1))
+        self.bind("<Down>", lambda event: self._moveSelection(1))
+        self.bind("<Prior>", lambda event: self._moveSelection(-self._rows))
+        self.bind("<Next>", lambda event: self._moveSelection(self._rows))
+        self.setSource(source, size)
+
+    def setSource(self, source, size = None):
+        """Shows the items of source.  The source is either a sequence,
+        or a function getItems(first, last) that returns the items from
+        first up to but not including last.  For a function, size is the
+        number of items, or a function that returns it."""
+        if callable(source):
+            if size is None:
+                raise ValueError("A function source needs a size")
+            self._getItems = source
+            self._getSize = size if callable(size) else lambda: size
+        else:
+            self._getItems = lambda first, last: \
+                             [source[index] for index in range(first, last)]
+            self._getSize = lambda: len(source)
+        self._top = 0
+        self._selected = -1
+        self.refresh()
+
+    def refresh(self):
+        """Redraws the rows in view.  Call this after the source has
+        changed, for example when items were added to it."""
+        size = self.size()
+        self._top = max(0, min(self._top, size - self._rows))
+        if self._selected >= size:
+            self._selected = -1
+        # One row more than fits, so that a partly visible row is filled
+        last = min(self._top + self._rows + 1, size)
+        self.setItems(self._getItems(self._top, last))
+        row = self._selected - self._top
+        if 0 <= row < last - self._top:
+            self.selection_set(row)
+        if self._yscrollcommand:
+            self._yscrollcommand(*self.yview())
+
+    def size(self):
+        """Returns the number of items in the list."""
+        return self._getSize()
+
+    def _rowCount(self):
+        return self._getSize()
+
+    def _showRows(self):
+        self.refresh()
+
+    def see(self, index):
+        """Scrolls the list so that the item at index is in view."""
+        if index < self._top:
+            self._top = index
+        elif index >= self._top + self._rows:
+            self._top = index - self._rows + 1
+        self.refresh()
+
+    def triggerListItemSelected(self, event):
+        """Runs the client's listItemSelected method with the position
+        of the selected item in the whole list."""
+        tup = self.curselection()
+        if len(tup) == 0: return
+        self._selected = self._top + int(tup[0])
+        self._listItemSelected(self._selected)
+
+    def getSelectedIndex(self):
+        """Returns the index of the selected item or -1 if no item
+        is selected."""
+        return self._selected
+
+    def getSelectedItem(self):
+        """Returns the selected item or the empty string if no item
+        is selected."""
+        if self._selected == -1:
+            return ""
+        return self._asString(self._getItems(self._selected,
+                                             self._selected + 1)[0])
+
+    def setSelectedIndex(self, index):
+        """Selects the item at the index if it's in the range, and
+        scrolls it into view."""
+        if index < 0 or index >= self.size(): return
+        self._selected = index
+        self.see(index)
+
+    def clear(self):
+        """Removes all items from the list box."""
+        self.setSource(())
+
+    def getIndex(self, item):
+        """Returns the index of item if it's in the list box,
+        or -1 otherwise.  This searches the whole list."""
+        size = self.size()
+        chunk = 10000
+        for first in range(0, size, chunk):
+            items = self._getItems(first, min(first + chunk, size))
+            for offset, each in enumerate(items):
+                if self._asString(each) == item:
+                    return first + offset
+        return -1
+
+    def _moveSelection(self, count):
+        self.setSelectedIndex(max(0, min(self._selected + count,
+                                         self.size() - 1)))
+        if self._selected != -1:
+            self._listItemSelected(self._selected)
+        return "break"
+
 class EasyRadiobuttonGroup(tkinter.Frame):
     """Represents a group of radio buttons, only one of which
     is selected at any given time."""
 
     def __init__(self, parent, row, column, rowspan, columnspan, orient):
         tkinter.Frame.__init__(self, parent)
-        self.grid(row = row, column = column,
-                  rowspan = rowspan, columnspan = columnspan,
-                  sticky = N+S+E+W)
+        _grid(self, row = row, column = column,
+              rowspan = rowspan, columnspan = columnspan,
+              sticky = N+S+E+W)
         self._commonVar = tkinter.StringVar("")
         self._buttons = dict()
         self._orient = orient
@@ -548,6 +1181,19 @@ class EasyCanvas(tkinter.Canvas):
         tkinter.Canvas.__init__(self, parent,
                                 width = width, height = height,
                                 background = background)
+        # Last known text options of the text items, by item
+        self._textOptions = dict()
+        # The images of the image items, by item.  This also keeps the
+        # images alive, as Tk does not hold a reference to them
+        self._images = dict()
+        # Pending (command, remember) pairs while in a batch
+        self._batch = None
+        # Coalescing of drag events, see setDragCoalescing
+        self._dragInterval = None
+        self._dragEvent = None
+        self._dragSkipped = 0
+        self._dragJob = None
+        self._lastDrag = 0.0
         self.bind("<Double-Button-1>", self.mouseDoubleClicked)
         self.bind("<ButtonPress-1>", self.mousePressed)
         self.bind("<ButtonRelease-1>", self.mouseReleased)
@@ -579,6 +1225,63 @@ class EasyCanvas(tkinter.Canvas):
         dragged in the area of this canvas."""
         return
 
+    def setDragCoalescing(self, coalesce = True, frameInterval = 16):
+        """Turns coalescing of drag events on or off.  When on, only the
+        latest position of a drag is kept, and mouseDragged is called
+        at most once every frameInterval milliseconds, so a handler that
+        redraws does not fall behind the mouse.  The event then has an
+        attribute skipped: the number of motion events dropped since
+        the previous call.  A pending drag is delivered before
+        mouseReleased."""
+        if coalesce:
+            self._dragInterval = frameInterval
+            self.bind("<B1-Motion>", self._dragged)
+            self.bind("<ButtonRelease-1>", self._released)
+        else:
+            self._deliverDrag()
+            self._dragInterval = None
+            self.bind("<B1-Motion>", self.mouseDragged)
+            self.bind("<ButtonRelease-1>", self.mouseReleased)
+
+    def _dragged(self, event):
+        """Keeps the latest motion event, and delivers it right away if
+        the last drag was at least a frame ago, or else at the end of
+        the frame."""
+        if self._dragEvent is not None:
+            self._dragSkipped += 1
+        self._dragEvent = event
+        if self._dragJob is not None:
+            return
+        wait = self._dragInterval - 1000 * (time.perf_counter() - self._lastDrag)
+        if wait <= 0:
+            self._deliverDrag()
+        else:
+            self._dragJob = self.after(int(math.ceil(wait)), self._deliverDrag)
+
+    def _deliverDrag(self):
+        """Calls mouseDragged with the pending motion event, if any."""
+        if self._dragJob is not None:
+            self.after_cancel(self._dragJob)
+            self._dragJob = None
+        event = self._dragEvent
+        if event is None:
+            return
+        event.skipped = self._dragSkipped
+        self._dragEvent = None
+        self._dragSkipped = 0
+        self._lastDrag = time.perf_counter()
+        self.mouseDragged(event)
+
+    def _released(self, event):
+        self._deliverDrag()
+        self.mouseReleased(event)
+
+    def destroy(self):
+        if self._dragJob is not None:
+            self.after_cancel(self._dragJob)
+            self._dragJob = None
+        tkinter.Canvas.destroy(self)
+
     def getWidth(self):
         """Returns the width of the canvas."""
         return self["width"]
@@ -589,355 +1292,135 @@ class EasyCanvas(tkinter.Canvas):
 
     def drawLine(self, x0, y0, x1, y1,
                  fill = "black", width = 1):
-        item = self.create_line(x0, y0, x1, y1)
-        self.itemconfig(item, fill = fill, width = width)
-        return item
+        """Draws a line between the given points, with the given
+        fill color and width."""
+        return self._draw("line", (x0, y0, x1, y1),
+                          {"fill": fill, "width": width})
 
     def drawRectangle(self, x0, y0, x1, y1,
                       outline = "black", fill = None):
         """Draws a rectangle with the given corner points,
         outline color, and fill color."""
-        item = self.create_rectangle(x0, y0, x1, y1)
-        self.itemconfig(item, outline = outline, fill = fill)
-        return item
+        return self._draw("rectangle", (x0, y0, x1, y1),
+                          {"outline": outline, "fill": fill})
 
     def drawOval(self, x0, y0, x1, y1,
                  outline = "black", fill = None):
         """Draws an ovel within the given corner points,
         with the given outline color and fill color."""
-        item = self.create_oval(x0, y0, x1, y1)
-        self.itemconfig(item, outline = outline, fill = fill)
-        return item
+        return self._draw("oval", (x0, y0, x1, y1),
+                          {"outline": outline, "fill": fill})
 
     def drawText(self, text, x, y, fill = "black", **kwargs):
         """Draws the given text (a string) at the given coordinates
         with the given fill color.  The string is centered vertically
         and horizontally at the given coordinates."""
-        item = self.create_text(x, y, **kwargs)
-        self.itemconfig(item, text = text, fill = fill)
-        return item
+        kwargs.update(text = text, fill = fill)
+        textOptions = {"text": text, "fill": fill,
+                       "font": kwargs.get("font")}
+        return self._draw("text", (x, y), kwargs,
+                          (self._textOptions, textOptions))
 
     def drawImage(self, image, x, y, anchor = CENTER):
         """Draws the given image (a PhotoImage) at the given coordinates.
         The image is centered at the given coordinates by default."""
-        item = self.create_image(x, y, image = image,
-                                 anchor = anchor)
-        self.itemconfig(item, image = image, anchor = anchor)
-        return item
+        return self._draw("image", (x, y),
+                          {"image": image, "anchor": anchor},
+                          (self._images, image))
+
+    def _draw(self, itemType, coords, options, remember = None):
+        """Creates an item with all of its options in a single call
+        to Tk, and returns the item.  remember is an optional pair
+        (dictionary, value); the value is stored in the dictionary
+        under the new item.  In a batch, the item is queued instead
+        and None is returned."""
+        if self._batch is None:
+            create = getattr(self, "create_" + itemType)
+            item = create(*coords, **options)
+            if remember is not None:
+                remember[0][item] = remember[1]
+            return item
+        command = [str(self), "create", itemType]
+        command.extend(coords)
+        for name, value in options.items():
+            if value is not None:
+                command.extend(("-" + name.rstrip("_"), value))
+        self._batch.append((tuple(command), remember))
+        return None
+
+    @contextlib.contextmanager
+    def batch(self):
+        """Collects the shapes drawn in a with block and sends them to Tk
+        as one script when the block ends:
+
+            with canvas.batch() as items:
+                canvas.drawLine(...)
+                canvas.drawText(...)
+
+        The draw methods return None inside the block; the list items
+        receives the item numbers, in drawing order, when the block ends.
+        A batch inside a batch joins the outer one, and its items are
+        added to the outer list.  If the block raises an exception,
+        nothing is drawn."""
+        if self._batch is not None:
+            yield []
+            return
+        self._batch = []
+        items = []
+        try:
+            yield items
+            pending = self._batch
+        finally:
+            self._batch = None
+        if pending:
+            # A single Tcl call that runs every command and returns
+            # the list of the new item numbers
+            result = self.tk.call("apply", "commands {lmap c $commands {{*}$c}}",
+                                  tuple(command for command, _ in pending))
+            items.extend(int(item) for item in self.tk.splitlist(result))
+            for item, (_, remember) in zip(items, pending):
+                if remember is not None:
+                    remember[0][item] = remember[1]
+
+    def setText(self, item, text = None, fill = None, font = None):
+        """Updates the text, fill color, and/or font of a text item
+        created by drawText in place.  Only the options that are given
+        and have changed are sent to Tk, in a single call; nothing is
+        sent if none of them has changed."""
+        options = self._textOptions.setdefault(item, dict())
+        changed = dict()
+        for name, value in (("text", text), ("fill", fill), ("font", font)):
+            if value is not None and options.get(name) != value:
+                changed[name] = options[name] = value
+        if changed:
+            self.itemconfig(item, **changed)
+
+    def setImage(self, item, image):
+        """Shows the given image (a PhotoImage) in an image item created
+        by drawImage, in place.  Nothing is sent to Tk if the item
+        already shows the image."""
+        if self._images.get(item) is not image:
+            self._images[item] = image
+            self.itemconfig(item, image = image)
 
     def deleteItem(self, item):
         """Removes and erases the shape with the given item
         number from the canvas."""
+        self._textOptions.pop(item, None)
+        self._images.pop(item, None)
         self.delete(item)
 
-# Support classes for dialogs.
-
-class MessageBox(tkinter.simpledialog.Dialog):
-    """Represents a message dialog with a scrollable text area."""
-
-    @classmethod
-    def message(cls, title = "", message = "", width = 25, height = 5):
-        MessageBox(tkinter.Frame(), title, message, width, height)
-
-    def __init__(self, parent, title, message, width, height):
-        """Set up the window and widgets."""
-        self._message = message
-        self._width = width
-        self._height = height
-        self._modified = False
-        tkinter.simpledialog.Dialog.__init__(self, parent, title)
-
-    def body(self, master):
-        self.resizable(0, 0)
-        yScroll = tkinter.Scrollbar(master, orient = VERTICAL)
-        yScroll.grid(row = 0, column = 1, sticky = N+S)
-        output = tkinter.Text(master, width = self._width, height = self._height,
-                      padx = 5, pady = 5, wrap = WORD,
-                      yscrollcommand = yScroll.set)
-        output.grid(row = 0, column = 0, sticky = N+W+S+E)
-        output.insert("1.0", self._message)
-        output["state"] = DISABLED
-        yScroll["command"] = output.yview
-        return output
-
-    def buttonbox(self):
-        '''add standard button box.
-        override if you do not want the standard buttons'''
-        box = tkinter.Frame(self)
-        w = tkinter.Button(box, text="OK", width = 10,
-                           command = self.ok, default = ACTIVE)
-        w.pack()
-        self.bind("<Return>", self.ok)
-        box.pack()
-
-    def apply(self):
-        """Quits the dialog."""
-        self._modified = True
-
-    def modified(self):
-        return self._modified
-
-class PrompterBox(tkinter.simpledialog.Dialog):
-    """Represents an input dialog with a text field."""
-
-    @classmethod
-    def prompt(cls, title = "", promptString = "", inputText = "", fieldWidth = 20):
-        """Creates and pops up an input dialog."""
-        dlg = PrompterBox(tkinter.Frame(), title, promptString, inputText, fieldWidth)
-        return dlg.getText()
-
-    def __init__(self, parent, title, promptString, inputText, fieldWidth):
-        """Set up the window and widgets."""
-        self._prompt = promptString
-        self._text = inputText
-        self._width = fieldWidth
-        self._modified = False
-        tkinter.simpledialog.Dialog.__init__(self, parent, title)
-
-    def body(self, master):
-        self.resizable(0, 0)
-        label = tkinter.Label(master, text = self._prompt)
-        label.grid(row = 0, column = 0, padx = 5, sticky = N+W+S+E)
-        self._field = TextField(master, self._text, self._width, NORMAL)
-        self._field.grid(row = 1, column = 0, padx = 5, sticky = N+W+S+E)
-        return self._field
-
-    def buttonbox(self):
-        '''add standard button box.
-        override if you do not want the standard buttons'''
-        box = tkinter.Frame(self)
-        w = tkinter.Button(box, text="OK", width = 10,
-                           command = self.ok, default = ACTIVE)
-        w.pack()
-        self.bind("<Return>", self.ok)
-        box.pack()
-
-    def apply(self):
-        """Quits the dialog."""
-        self._modified = True
-
-    def modified(self):
-        return self._modified
-
-    def getText(self):
-        """Returns the text currently in the text field."""
-        return self._field.getText()
-
-class EasyDialog(tkinter.simpledialog.Dialog):
-    """Represents a general-purpose dialog.  Subclasses should include
-    body and apply methods."""
-
-    def __init__(self, parent, title = ""):
-        """Set up the window and widgets."""
-        self._modified = False
-        tkinter.simpledialog.Dialog.__init__(self, parent, title)
-
-    def modified(self):
-        """Returns the modified status of the dialog."""
-        return self._modified
-
-    def setModified(self):
-        self._modified = True
-
-    def addLabel(self, master, text, row, column,
-                 columnspan = 1, rowspan = 1,
-                 sticky = N+W, font = None):
-        """Creates and inserts a label at the row and column,
-        and returns the label."""
-        label = tkinter.Label(master, text = text, font = font)
-        master.rowconfigure(row, weight = 1)
-        master.columnconfigure(column, weight = 1)
-        label.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
-        return label
-
-    def addButton(self, master, text, row, column,
-                  columnspan = 1, rowspan = 1,
-                  command = lambda: None,
-                  state = NORMAL):
-        """Creates and inserts a button at the row and column,
-        and returns the button."""
-        button = tkinter.Button(master, text = text,
-                                command = command, state = state)
-        master.rowconfigure(row, weight = 1)
-        master.columnconfigure(column, weight = 1)
-        button.grid(row = row, column = column,
-                    columnspan = columnspan, rowspan = rowspan,
-                    padx = 5, pady = 5)
-        return button
-
-    def addFloatField(self, master, value, row, column,
-                      columnspan = 1, rowspan = 1,
-                      width = 20, precision = None,
-                      sticky = N+E, state = NORMAL):
-        """Creates and inserts a float field at the row and column,
-        and returns the float field."""
-        field = FloatField(master, value, width, precision, state)
-        master.rowconfigure(row, weight = 1)
-        master.columnconfigure(column, weight = 1)
-        field.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
-        return field
-
-    def addIntegerField(self, master, value, row, column,
-                        columnspan = 1, rowspan = 1,
-                        width = 10, sticky = N+E, state = NORMAL):
-        """Creates and inserts an integer field at the row and column,
-        and returns the integer field."""
-        field = IntegerField(master, value, width, state)
-        master.rowconfigure(row, weight = 1)
-        master.columnconfigure(column, weight = 1)
-        field.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
-        return field
-
-    def addTextField(self, master, text, row, column,
-                     columnspan = 1, rowspan = 1,
-                     width = 20, sticky = N+E, state = NORMAL):
-        """Creates and inserts a text field at the row and column,
-        and returns the text field."""
-        field = TextField(master, text, width, state)
-        master.rowconfigure(row, weight = 1)
-        master.columnconfigure(column, weight = 1)
-        field.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
-        return field
-
-    def addCheckbutton(self, master, text, row, column,
-                       rowspan = 1, columnspan = 1,
-                       sticky = N+S+E+W, command = lambda : 0):
-        """Creates and inserts check button at the row and column,
-        and returns the check button."""
-        cb = EasyCheckbutton(master, text, command)
-        master.rowconfigure(row, weight = 1)
-        master.columnconfigure(column, weight = 1)
-        cb.grid(row = row, column = column,
-                columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
-        return cb
-
-    def addRadiobuttonGroup(self, master, row, column,
-                            rowspan = 1, columnspan = 1, orient = VERTICAL):
-        """Creates and returns a radio button group."""
-        return EasyRadiobuttonGroup(master, row, column, rowspan, columnspan, orient)
-
-    def addScale(self, master, row, column, rowspan = 1, columnspan = 1,
-                 command = lambda value: value, from_ = 0, to = 0,
-                 label = "", length = 100, orient = HORIZONTAL,
-                 resolution = 1, tickinterval = 0):
-        """Creates and inserts a scale at the row and column,
-        and returns the scale."""
-        scale = tkinter.Scale(master, command = command, from_ = from_, to = to,
-                              label = label, length = length,
-                              orient = orient, resolution = resolution,
-                              tickinterval = tickinterval, relief = "sunken",
-                              borderwidth = 4)
-        master.rowconfigure(row, weight = 1)
-        master.columnconfigure(column, weight = 1)
-        scale.grid(row = row, column = column, columnspan = columnspan,
-                   rowspan = rowspan, sticky = N+S+E+W)
-        return scale
-
-    def addTextArea(self, master, text, row, column, rowspan = 1, columnspan = 1,
-                    width = 80, height = 5, wrap = NONE):
-        """Creates and inserts a multiline text area at the row and column,
-        and returns the text area.  Vertical and horizontal scrollbars are
-        provided."""
-        frame = tkinter.Frame(master)
-        frame.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   sticky = N+S+E+W)
-        master.columnconfigure(column, weight = 1)
-        master.rowconfigure(row, weight = 1)
-        xScroll = tkinter.Scrollbar(frame, orient = HORIZONTAL)
-        xScroll.grid(row = 1, column = 0, sticky = E+W)
-        yScroll = tkinter.Scrollbar(frame, orient = VERTICAL)
-        yScroll.grid(row = 0, column = 1, sticky = N+S)
-        area = TextArea(frame, text, width, height,
-                        xScroll.set, yScroll.set, wrap)
-        area.grid(row = 0, column = 0,
-                  padx = 5, pady = 5, sticky = N+S+E+W)
-        frame.columnconfigure(0, weight = 1)
-        frame.rowconfigure(0, weight = 1)
-        xScroll["command"] = area.xview
-        yScroll["command"] = area.yview
-        return area
-
-    def addListbox(self, master, row, column, rowspan = 1, columnspan = 1,
-                   width = 10, height = 5, listItemSelected = lambda index: index):
-        """Creates and inserts a scrolling list box at the row and column, with a
-        width and height in lines and columns of text, and a default item selection
-        method, and returns the list box."""
-        frame = tkinter.Frame(master)
-        frame.grid(row = row, column = column, columnspan = columnspan, rowspan = rowspan,
-                   sticky = N+S+E+W)
-        master.columnconfigure(column, weight = 1)
-        master.rowconfigure(row, weight = 1)
-        yScroll = tkinter.Scrollbar(frame, orient = VERTICAL)
-        yScroll.grid(row = 0, column = 1, sticky = N+S)
-        listBox = EasyListbox(frame, width, height, yScroll.set, listItemSelected)
-        listBox.grid(row = 0, column = 0, sticky = N+S+E+W)
-        frame.columnconfigure(0, weight = 1)
-        frame.rowconfigure(0, weight = 1)
-        yScroll["command"] = listBox.yview
-        return listBox
-
-    def addCanvas(self, master, canvas = None, row = 0, column = 0,
-                  rowspan = 1, columnspan = 1, width = 200, height = 100,
-                  background = "white"):
-        """Creates and inserts a canvas at the row and column,
-        and returns the canvas."""
-        if not canvas:
-            canvas = EasyCanvas(master, width = width, height = height,
-                                background = background)
-        canvas.grid(row = row, column = column,
-                    rowspan = rowspan, columnspan = columnspan,
-                    sticky = W+E+N+S)
-        master.columnconfigure(column, weight = 10)
-        master.rowconfigure(row, weight = 10)
-        return canvas
-
-    def addMenuBar(self, master, row, column, rowspan = 1, columnspan = 1,
-                   orient = "horizontal"):
-        """Creates and inserts a menu bar at the row and column,
-        and returns the menu bar."""
-        if not orient in ("horizontal", "vertical"):
-            raise ValueError("orient must be horizontal or vertical")
-        menuBar = EasyMenuBar(master, orient)
-        menuBar.grid(row = row, column = column,
-                     rowspan = rowspan, columnspan = columnspan,
-                     sticky = N+W)
-        return menuBar
-
-    def messageBox(self, title = "", message = "", width = 25, height = 5):
-        """Creates and pops up a message box, with the given title,
-        message, and width and height in rows and columns of text."""
-        dlg = MessageBox(self, title, message, width, height)
-        return dlg.modified()
-
-        # Added 12-18-2012
-    def addPanel(self, master, row, column,
-                 rowspan = 1, columnspan = 1, background = "white"):
-        """Creates and returns a panel."""
-        return EasyPanel(master, row, column, rowspan, columnspan, background)
-
-
- 
 # Added 12-18-2012
-class EasyPanel(tkinter.Frame):
+class EasyPanel(_Layout, tkinter.Frame):
     """Organizes a group of widgets in a panel (nested frame)."""
 
     def __init__(self, parent, row, column, rowspan, columnspan, background):
         tkinter.Frame.__init__(self, parent)
         parent.rowconfigure(row, weight = 1)
         parent.columnconfigure(column, weight = 1)
-        self.grid(row = row, column = column,
-                  rowspan = rowspan, columnspan = columnspan,
-                  sticky = N+S+E+W)
+        _grid(self, row = row, column = column,
+              rowspan = rowspan, columnspan = columnspan,
+              sticky = N+S+E+W)
         self.setBackground(background)
 
     def setBackground(self, color):
@@ -954,9 +1437,9 @@ class EasyPanel(tkinter.Frame):
                                 command = command, state = state)
         self.rowconfigure(row, weight = 1)
         self.columnconfigure(column, weight = 1)
-        button.grid(row = row, column = column,
-                    columnspan = columnspan, rowspan = rowspan,
-                    padx = 5, pady = 5)
+        _grid(button, row = row, column = column,
+              columnspan = columnspan, rowspan = rowspan,
+              padx = 5, pady = 5)
         return button
 
     def addLabel(self, text, row, column,
@@ -970,9 +1453,9 @@ class EasyPanel(tkinter.Frame):
                               foreground = foreground)
         self.rowconfigure(row, weight = 1)
         self.columnconfigure(column, weight = 1)
-        label.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
+        _grid(label, row = row, column = column,
+              columnspan = columnspan, rowspan = rowspan,
+              padx = 5, pady = 5, sticky = sticky)
         return label
 
     def addFloatField(self, value, row, column,
@@ -984,9 +1467,9 @@ class EasyPanel(tkinter.Frame):
         field = FloatField(self, value, width, precision, state)
         self.rowconfigure(row, weight = 1)
         self.columnconfigure(column, weight = 1)
-        field.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
+        _grid(field, row = row, column = column,
+              columnspan = columnspan, rowspan = rowspan,
+              padx = 5, pady = 5, sticky = sticky)
         return field
 
     def addIntegerField(self, value, row, column,
@@ -997,9 +1480,9 @@ class EasyPanel(tkinter.Frame):
         field = IntegerField(self, value, width, state)
         self.rowconfigure(row, weight = 1)
         self.columnconfigure(column, weight = 1)
-        field.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
+        _grid(field, row = row, column = column,
+              columnspan = columnspan, rowspan = rowspan,
+              padx = 5, pady = 5, sticky = sticky)
         return field
 
     def addTextField(self, text, row, column,
@@ -1010,9 +1493,9 @@ class EasyPanel(tkinter.Frame):
         field = TextField(self, text, width, state)
         self.rowconfigure(row, weight = 1)
         self.columnconfigure(column, weight = 1)
-        field.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
+        _grid(field, row = row, column = column,
+              columnspan = columnspan, rowspan = rowspan,
+              padx = 5, pady = 5, sticky = sticky)
         return field
 
     def addTextArea(self, text, row, column, rowspan = 1, columnspan = 1,
@@ -1021,9 +1504,9 @@ class EasyPanel(tkinter.Frame):
         and returns the text area.  Vertical and horizontal scrollbars are
         provided."""
         frame = tkinter.Frame(self)
-        frame.grid(row = row, column = column,
-                   columnspan = columnspan, rowspan = rowspan,
-                   sticky = N+S+E+W)
+        _grid(frame, row = row, column = column,
+              columnspan = columnspan, rowspan = rowspan,
+              sticky = N+S+E+W)
         self.columnconfigure(column, weight = 1)
         self.rowconfigure(row, weight = 1)
         xScroll = tkinter.Scrollbar(frame, orient = HORIZONTAL)
@@ -1041,18 +1524,25 @@ class EasyPanel(tkinter.Frame):
         return area
 
     def addListbox(self, row, column, rowspan = 1, columnspan = 1,
-                   width = 10, height = 5, listItemSelected = lambda index: index):
+                   width = 10, height = 5, listItemSelected = lambda index: index,
+                   source = None, size = None):
         """Creates and inserts a scrolling list box at the row and column, with a
         width and height in lines and columns of text, and a default item selection
-        method, and returns the list box."""
+        method, and returns the list box.  If a source is given (see
+        VirtualListbox.setSource), the list box only holds the rows in view.
+        A function source also needs the size."""
         frame = tkinter.Frame(self)
-        frame.grid(row = row, column = column, columnspan = columnspan, rowspan = rowspan,
-                   sticky = N+S+E+W)
+        _grid(frame, row = row, column = column, columnspan = columnspan, rowspan = rowspan,
+              sticky = N+S+E+W)
         self.columnconfigure(column, weight = 1)
         self.rowconfigure(row, weight = 1)
         yScroll = tkinter.Scrollbar(frame, orient = VERTICAL)
         yScroll.grid(row = 0, column = 1, sticky = N+S)
-        listBox = EasyListbox(frame, width, height, yScroll.set, listItemSelected)
+        if source is None:
+            listBox = EasyListbox(frame, width, height, yScroll.set, listItemSelected)
+        else:
+            listBox = VirtualListbox(frame, width, height, yScroll.set,
+                                     listItemSelected, source, size)
         listBox.grid(row = 0, column = 0, sticky = N+S+E+W)
         frame.columnconfigure(0, weight = 1)
         frame.rowconfigure(0, weight = 1)
@@ -1067,9 +1557,9 @@ class EasyPanel(tkinter.Frame):
         if not canvas:
             canvas = EasyCanvas(self, width = width, height = height,
                                 background = background)
-        canvas.grid(row = row, column = column,
-                    rowspan = rowspan, columnspan = columnspan,
-                    sticky = W+E+N+S)
+        _grid(canvas, row = row, column = column,
+              rowspan = rowspan, columnspan = columnspan,
+              sticky = W+E+N+S)
         self.columnconfigure(column, weight = 10)
         self.rowconfigure(row, weight = 10)
         return canvas
@@ -1087,8 +1577,8 @@ class EasyPanel(tkinter.Frame):
                               borderwidth = 4)
         self.rowconfigure(row, weight = 1)
         self.columnconfigure(column, weight = 1)
-        scale.grid(row = row, column = column, columnspan = columnspan,
-                   rowspan = rowspan, sticky = N+S+E+W)
+        _grid(scale, row = row, column = column, columnspan = columnspan,
+              rowspan = rowspan, sticky = N+S+E+W)
         return scale
 
     def addMenuBar(self, row, column, rowspan = 1, columnspan = 1,
@@ -1098,9 +1588,9 @@ class EasyPanel(tkinter.Frame):
         if not orient in ("horizontal", "vertical"):
             raise ValueError("orient must be horizontal or vertical")
         menuBar = EasyMenuBar(self, orient)
-        menuBar.grid(row = row, column = column,
-                     rowspan = rowspan, columnspan = columnspan,
-                     sticky = N+W)
+        _grid(menuBar, row = row, column = column,
+              rowspan = rowspan, columnspan = columnspan,
+              sticky = N+W)
         return menuBar
 
     def addCheckbutton(self, text, row, column,
@@ -1111,9 +1601,9 @@ class EasyPanel(tkinter.Frame):
         cb = EasyCheckbutton(self, text, command)
         self.rowconfigure(row, weight = 1)
         self.columnconfigure(column, weight = 1)
-        cb.grid(row = row, column = column,
-                columnspan = columnspan, rowspan = rowspan,
-                   padx = 5, pady = 5, sticky = sticky)
+        _grid(cb, row = row, column = column,
+              columnspan = columnspan, rowspan = rowspan,
+              padx = 5, pady = 5, sticky = sticky)
         return cb
 
     def addRadiobuttonGroup(self, row, column,
@@ -1127,6 +1617,327 @@ class EasyPanel(tkinter.Frame):
         return EasyPanel(self, row, column, rowspan, columnspan, background)
 
 
+# Easing curves for Animation.  Each maps the elapsed fraction of the
+# duration (0.0 to 1.0) to the progress of the animation.
+
+def linear(t):
+    return t
+
+def easeInQuad(t):
+    return t * t
+
+def easeOutQuad(t):
+    return t * (2 - t)
+
+def easeInOutQuad(t):
+    return 2 * t * t if t < 0.5 else 1 - 2 * (1 - t) * (1 - t)
+
+def easeOutCubic(t):
+    return 1 - (1 - t) ** 3
+
+
+class Animation(object):
+    """Runs an animation on the event loop of a widget.  Each frame
+    calls frame(progress), where progress is the eased fraction of
+    the duration (in milliseconds) that has passed, from 0.0 to 1.0.
+
+    The progress is computed from a monotonic clock, not counted in
+    frames, so the animation always takes its duration: when a frame
+    is late, the frames it missed are dropped instead of shown late.
+    The first frame shows progress 0.0 and the last one 1.0, after
+    which done() is called, if given.
+
+    The time spent in each frame and between frames is recorded, see
+    stats."""
+
+    def __init__(self, widget, duration, frame, easing = linear,
+                 frameInterval = 16, done = None):
+        self._widget = widget
+        self.duration = duration
+        self.frameInterval = frameInterval
+        self._frame = frame
+        self._easing = easing
+        self._done = done
+        self._job = None
+        self._start = None
+        self._lastTick = None
+        self._lastSlot = 0
+        # The statistics of the last run
+        self.frames = 0
+        self.dropped = 0
+        self.elapsed = None
+        self.frameTimes = []
+        self.intervals = []
+
+    def start(self):
+        """Starts the animation, or restarts it if it is running.
+        The first frame is shown right away."""
+        self.stop()
+        self.frames = self.dropped = 0
+        self.elapsed = None
+        self.frameTimes = []
+        self.intervals = []
+        self._start = time.perf_counter()
+        self._lastTick = None
+        self._lastSlot = 0
+        self._tick()
+
+    def stop(self):
+        """Stops the animation where it is, without calling done()."""
+        if self._job is not None:
+            self._widget.after_cancel(self._job)
+            self._job = None
+        self._start = None
+
+    def isRunning(self):
+        """Returns True while the animation is running."""
+        return self._start is not None
+
+    def stats(self):
+        """Returns the statistics of the last run as a dictionary:
+        the number of frames shown and dropped, the intended and the
+        actual duration, and the mean and worst time spent in a frame
+        and between frames, all in milliseconds."""
+        def summary(samples):
+            if not samples:
+                return {"mean": None, "max": None}
+            return {"mean": 1000 * sum(samples) / len(samples),
+                    "max": 1000 * max(samples)}
+        return {"frames": self.frames, "dropped": self.dropped,
+                "duration": self.duration,
+                "elapsed": None if self.elapsed is None
+                           else 1000 * self.elapsed,
+                "frameTime": summary(self.frameTimes),
+                "interval": summary(self.intervals)}
+
+    def _tick(self):
+        """Shows the frame for the current time, and schedules the
+        next one at the next multiple of the frame interval."""
+        self._job = None
+        now = time.perf_counter()
+        elapsed = 1000 * (now - self._start)
+        slot = int(elapsed // self.frameInterval)
+        if self._lastTick is not None:
+            self.intervals.append(now - self._lastTick)
+            self.dropped += max(0, slot - self._lastSlot - 1)
+        self._lastTick = now
+        self._lastSlot = slot
+
+        t = 1.0 if elapsed >= self.duration else elapsed / self.duration
+        self._frame(self._easing(t))
+        self.frameTimes.append(time.perf_counter() - now)
+        self.frames += 1
+        if self._start is None:
+            return  # Stopped by the frame function
+        if t >= 1.0:
+            self.elapsed = now - self._start
+            self._start = None
+            if self._done:
+                self._done()
+            return
+
+        due = min((slot + 1) * self.frameInterval, self.duration)
+        delay = due - 1000 * (time.perf_counter() - self._start)
+        self._job = self._widget.after(max(0, int(math.ceil(delay))), self._tick)
+
+
+# Opt-in profiling of the calls to Tcl.  Nothing here runs unless
+# profiling is enabled, so it costs nothing otherwise.
+
+class _ProfiledTk(object):
+    """Stands in for a Tcl interpreter and times the calls that make a
+    round trip to Tcl.  Everything else is passed on unchanged."""
+
+    def __init__(self, interp, profiler):
+        self._interp = interp
+        self._profiler = profiler
+        for name in ("call", "eval", "globalsetvar", "globalgetvar",
+                     "setvar", "getvar"):
+            setattr(self, name, self._timed(getattr(interp, name)))
+
+    def _timed(self, function):
+        profiler = self._profiler
+        def timed(*args):
+            start = time.perf_counter()
+            try:
+                return function(*args)
+            finally:
+                profiler.record(time.perf_counter() - start)
+        return timed
+
+    def __getattr__(self, name):
+        return getattr(self._interp, name)
+
+
+class Profiler(object):
+    """Counts and times every call to Tcl, by the breezypythongui method
+    that caused it and by the event handler that was running.  Use
+    enableProfiling to create one."""
+
+    def __init__(self, path = None):
+        self.path = path
+        self.methods = dict()
+        self.handlers = dict()
+        self._method = None
+        self._handlers = []
+        self._calls = 0
+        self._seconds = 0.0
+
+    def record(self, seconds):
+        """Charges one Tcl call to the current method and handler."""
+        stats = self.methods.setdefault(self._method or "(direct)",
+                                        {"calls": 0, "seconds": 0.0})
+        stats["calls"] += 1
+        stats["seconds"] += seconds
+        self._calls += 1
+        self._seconds += seconds
+
+    def wrapMethod(self, name, function):
+        """Returns function wrapped so that the Tcl calls it makes are
+        charged to name.  Calls from one breezypythongui method to
+        another are charged to the outermost one."""
+        profiler = self
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if profiler._method is not None:
+                return function(*args, **kwargs)
+            profiler._method = name
+            try:
+                return function(*args, **kwargs)
+            finally:
+                profiler._method = None
+        return wrapper
+
+    def wrapClasses(self, classes):
+        """Wraps the public methods of the classes with wrapMethod."""
+        for cls in classes:
+            for name, value in list(vars(cls).items()):
+                if isinstance(value, types.FunctionType) and \
+                   not name.startswith("_"):
+                    setattr(cls, name,
+                            self.wrapMethod(cls.__name__ + "." + name, value))
+
+    def wrapHandler(self, function):
+        """Returns the __call__ of a tkinter.CallWrapper wrapped so
+        that the Tcl calls made by each event handler are totaled.
+        Each run of a handler is one frame of work."""
+        profiler = self
+        def __call__(callWrapper, *args):
+            func = callWrapper.func
+            name = getattr(func, "__qualname__", repr(func))
+            if "<locals>" in name:
+                # after() and similar wrap the handler in a closure
+                name = getattr(func, "__name__", name)
+            profiler._handlers.append((profiler._calls, profiler._seconds))
+            try:
+                return function(callWrapper, *args)
+            finally:
+                calls, seconds = profiler._handlers.pop()
+                profiler.recordHandler(name, profiler._calls - calls,
+                                       profiler._seconds - seconds)
+        return __call__
+
+    def recordHandler(self, name, calls, seconds):
+        """Adds one frame of calls and seconds to the handler's totals."""
+        stats = self.handlers.setdefault(name, {"frames": 0, "calls": 0,
+                                                "seconds": 0.0,
+                                                "maxCalls": 0,
+                                                "maxSeconds": 0.0})
+        stats["frames"] += 1
+        stats["calls"] += calls
+        stats["seconds"] += seconds
+        stats["maxCalls"] = max(stats["maxCalls"], calls)
+        stats["maxSeconds"] = max(stats["maxSeconds"], seconds)
+
+    def attach(self, widget):
+        """Times the Tcl calls of widget's interpreter.  Widgets created
+        later share the timed interpreter."""
+        root = widget._root()
+        if not isinstance(root.tk, _ProfiledTk):
+            root.tk = _ProfiledTk(root.tk, self)
+        widget.tk = root.tk
+
+    def report(self):
+        """Returns the totals as a dictionary."""
+        return {"calls": self._calls, "seconds": self._seconds,
+                "methods": self.methods, "handlers": self.handlers}
+
+    def dump(self):
+        """Writes the totals as JSON to the path given to enableProfiling,
+        or to standard error if there is none."""
+        import json
+        if self.path:
+            with open(self.path, "w") as f:
+                json.dump(self.report(), f, indent = 2, sort_keys = True)
+        else:
+            json.dump(self.report(), sys.stderr, indent = 2, sort_keys = True)
+
+_profiler = None
+
+def enableProfiling(path = None):
+    """Starts counting and timing the calls to Tcl, and returns the
+    Profiler.  The totals are written as JSON to path (or standard
+    error) when the program exits.  Call this before any window is
+    created; setting the environment variable BREEZYPYTHONGUI_PROFILE
+    to a path does so on import."""
+    global _profiler
+    if _profiler:
+        return _profiler
+    _profiler = Profiler(path)
+    _profiler.wrapClasses(cls for cls in list(globals().values())
+                          if isinstance(cls, type) and cls.__module__ == __name__
+                          and cls not in (Profiler, _ProfiledTk))
+    if "breezydialogs" in sys.modules:
+        _profiler.wrapClasses(_dialogClasses())
+    tkinter.CallWrapper.__call__ = _profiler.wrapHandler(tkinter.CallWrapper.__call__)
+    if getattr(tkinter, "_default_root", None):
+        _profiler.attach(tkinter._default_root)
+    atexit.register(_profiler.dump)
+    return _profiler
+
+# The dialog classes are imported from breezydialogs on first use.
+
+_DIALOGS = ("MessageBox", "PrompterBox", "EasyDialog", "DialogPool")
+
+def _dialogClasses():
+    """Imports the dialog classes, and returns them."""
+    import breezydialogs
+    classes = [getattr(breezydialogs, name) for name in _DIALOGS]
+    if _profiler and not hasattr(breezydialogs, "_profiled"):
+        breezydialogs._profiled = True
+        _profiler.wrapClasses(classes)
+    return classes
+
+def _dialog(name):
+    """Returns the dialog class with the given name."""
+    return globals().get(name) or __getattr__(name)
+
+def __getattr__(name):
+    if name in _DIALOGS:
+        for cls in _dialogClasses():
+            globals()[cls.__name__] = cls
+        return globals()[name]
+    raise AttributeError("module " + repr(__name__) +
+                         " has no attribute " + repr(name))
+
+def __dir__():
+    return sorted(list(globals()) + list(_DIALOGS))
+
+# Star imports trigger __getattr__ for the dialog classes.
+__all__ = ["N", "S", "E", "W", "CENTER", "END", "NORMAL", "DISABLED", "NONE",
+           "WORD", "VERTICAL", "HORIZONTAL", "RAISED", "SINGLE", "ACTIVE",
+           "EasyFrame", "AbstractField", "FloatField", "IntegerField",
+           "TextField", "TextArea", "EasyListbox", "VirtualListbox",
+           "EasyRadiobuttonGroup", "EasyCheckbutton", "EasyMenuBar",
+           "EasyMenubutton", "EasyMenuItem", "EasyCanvas", "EasyPanel",
+           "linear", "easeInQuad", "easeOutQuad", "easeInOutQuad",
+           "easeOutCubic", "Animation", "Profiler",
+           "enableProfiling"] + list(_DIALOGS)
+
+if os.environ.get("BREEZYPYTHONGUI_PROFILE"):
+    enableProfiling(os.environ["BREEZYPYTHONGUI_PROFILE"])
+
+
 
 
 
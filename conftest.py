@@ -0,0 +1,23 @@
+"""Fixtures shared by the tests of the index files."""
+import pytest
+
+
+@pytest.fixture(scope='module')
+def built_index(tmp_path_factory):
+    """Returns a function build(build_index, index_class, source,
+    **kwargs) that writes an index for {source} to a temporary file with
+    build_index(source, path=..., **kwargs), and returns a pair (the
+    value build_index returned, the index opened with index_class).
+    The indexes are closed when the tests of the module are done."""
+    opened = []
+
+    def build(build_index, index_class, source, **kwargs):
+        path = str(tmp_path_factory.mktemp('index') / 'index.idx')
+        count = build_index(source, path=path, **kwargs)
+        index = index_class(path)
+        opened.append(index)
+        return count, index
+
+    yield build
+    for index in opened:
+        index.close()
@@ -0,0 +1,113 @@
+"""The Conundrum round of Countdown: a scrambled nine-letter word.
+
+A conundrum must have exactly one answer, so only the nine-letter
+words that have no other anagram in the word list can be used. That
+set is found once, offline, with
+
+    python conundrum.py [word list] [path]
+
+and written to a compact index file: the words one after the other,
+nine bytes each. At runtime the file is memory-mapped, so picking a
+puzzle is reading nine bytes at a random offset, without ever scanning
+the word list.
+
+File layout (all integers little-endian):
+
+    header    magic, version, word length L, number of words N
+    words     N x L bytes: the words in lowercase, sorted
+"""
+import logging
+import os
+import random
+import struct
+import sys
+
+from letters import DEFAULT_WORDS, TILES, read_words, word_key
+from mappedindex import MappedIndex, write_index
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+MAGIC = b'CDCN'
+VERSION = 1
+HEADER = struct.Struct('<4sHHI')
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'conundrum.idx')
+
+
+def unique_words(words, length=TILES):
+    """Returns a sorted list of the words of {length} letters in the
+    iterable {words} that are not an anagram of any other word."""
+    anagrams = {}
+    for word in words:
+        if len(word) == length:
+            anagrams.setdefault(word_key(word), []).append(word)
+    return sorted(group[0] for group in anagrams.values() if len(group) == 1)
+
+
+def build_index(words, path=DEFAULT_PATH, length=TILES):
+    """Writes the unique words of {length} letters in the iterable
+    {words} (see letters.read_words()) to the index at {path}. Returns
+    the number of words in the index."""
+    puzzles = unique_words(words, length)
+    if not puzzles:
+        raise ValueError(f'There are no words of {length} letters without anagrams')
+
+    with write_index(path) as f:
+        f.write(HEADER.pack(MAGIC, VERSION, length, len(puzzles)))
+        for word in puzzles:
+            f.write(word.encode())
+    return len(puzzles)
+
+
+def scramble(word, rng=random):
+    """Returns the letters of {word} in a random order that is
+    different from the word itself, if there is one."""
+    letters = list(word)
+    if len(set(letters)) < 2:
+        return word
+    while True:
+        rng.shuffle(letters)
+        scrambled = ''.join(letters)
+        if scrambled != word:
+            return scrambled
+
+
+class ConundrumIndex(MappedIndex):
+    """An index file written by build_index() (see MappedIndex)."""
+    MAGIC = MAGIC
+    VERSION = VERSION
+    HEADER = HEADER
+    DEFAULT_PATH = DEFAULT_PATH
+    NAME = 'a conundrum index'
+
+    def _read_header(self, fields):
+        self.length, self.count = fields
+        return self.count > 0
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, number):
+        """Returns word {number} of the index."""
+        if not 0 <= number < self.count:
+            raise IndexError('Conundrum number out of range')
+        offset = HEADER.size + number * self.length
+        return self._map[offset:offset + self.length].decode()
+
+    def pick(self, rng=random):
+        """Returns a random puzzle as a pair (scrambled, answer)."""
+        answer = self[rng.randrange(self.count)]
+        return scramble(answer, rng), answer
+
+
+def main():
+    logging.basicConfig()
+    words_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_WORDS
+    path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PATH
+    count = build_index(read_words(words_path), path)
+    logger.info('Wrote %d words to %s', count, path)
+
+
+if __name__ == '__main__':
+    main()
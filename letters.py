@@ -0,0 +1,211 @@
+"""The Letters round of Countdown: the tiles and a dictionary solver.
+
+The player picks nine tiles, each a vowel or a consonant, and makes
+the longest word possible from them. The tiles are drawn with the
+weights in LETTERS, the frequencies of the letters on the show.
+
+The solver looks words up in an index that is built once, offline,
+from a word list (one word per line) with
+
+    python letters.py [word list] [path]
+
+Words with the same letters are anagrams of each other, so the index
+maps the sorted letters of a word (its key) to all the words with that
+key. To solve a round, every distinct combination of the tiles is
+sorted and looked up: at most 511 lookups for nine tiles. At runtime
+the file is memory-mapped, and a lookup is a hash and a probe or two.
+
+File layout (all integers little-endian):
+
+    header    magic, version, number of slots S, number of keys,
+              number of words
+    slots     S x uint32: the offset of the entry in the file, or 0
+              for an empty slot; the slot of a key is its CRC-32
+              modulo S, then the next slots in turn (S is a power of 2)
+    entries   one per key: the length of the key (uint8), the key,
+              the number of words (uint16), and each word as its
+              length (uint8) and its letters
+"""
+import itertools
+import logging
+import os
+import random
+import struct
+import sys
+import zlib
+
+from mappedindex import MappedIndex, write_index
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# The number of tiles of each letter in the vowel and consonant piles
+LETTERS = {
+    'vowel': {'A': 15, 'E': 21, 'I': 13, 'O': 13, 'U': 5},
+    'consonant': {'B': 2, 'C': 3, 'D': 6, 'F': 2, 'G': 3, 'H': 2, 'J': 1, 'K': 1,
+                  'L': 5, 'M': 4, 'N': 8, 'P': 4, 'Q': 1, 'R': 9, 'S': 9, 'T': 9,
+                  'V': 1, 'W': 1, 'X': 1, 'Y': 1, 'Z': 1},
+}
+TILES = 9
+MIN_VOWELS = 3
+MIN_CONSONANTS = 4
+
+MAGIC = b'CDLX'
+VERSION = 1
+HEADER = struct.Struct('<4sHIII')
+SLOT = struct.Struct('<I')
+EMPTY = 0
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'letters.idx')
+DEFAULT_WORDS = '/usr/share/dict/words'
+
+
+def draw_letter(kind, rng=random):
+    """Returns a random letter from the pile {kind}, 'vowel' or
+    'consonant', weighted by the number of tiles of each letter."""
+    pile = LETTERS[kind]
+    return rng.choices(list(pile), weights=list(pile.values()))[0]
+
+
+def allowed_kinds(tiles):
+    """Returns the kinds of tile ('vowel' and/or 'consonant') that may
+    be picked next after {tiles}, so that the round still ends with
+    at least MIN_VOWELS vowels and MIN_CONSONANTS consonants."""
+    if len(tiles) >= TILES:
+        return []
+    vowels = sum(1 for tile in tiles if tile in LETTERS['vowel'])
+    consonants = len(tiles) - vowels
+    left = TILES - len(tiles)
+    kinds = []
+    if MIN_CONSONANTS - consonants < left:
+        kinds.append('vowel')
+    if MIN_VOWELS - vowels < left:
+        kinds.append('consonant')
+    return kinds
+
+
+def word_key(word):
+    """Returns the key of {word}: its letters in lowercase, sorted."""
+    return ''.join(sorted(word.lower()))
+
+
+def read_words(path, longest=TILES, proper_nouns=False):
+    """Returns the distinct words in the word list at {path} that can
+    be played: two to {longest} letters from a to z. Entries with a
+    capital letter are proper nouns ("Paris"), which are not allowed,
+    and are left out unless {proper_nouns} is True."""
+    words = set()
+    with open(path, encoding='utf-8', errors='replace') as f:
+        for line in f:
+            word = line.strip()
+            if not proper_nouns and not word.islower():
+                continue
+            word = word.lower()
+            if 2 <= len(word) <= longest and word.isascii() and word.isalpha():
+                words.add(word)
+    return words
+
+
+def build_index(words, path=DEFAULT_PATH):
+    """Builds the index for the iterable {words} (see read_words()) and
+    writes it to {path}. Returns the number of keys in the index."""
+    anagrams = {}
+    count = 0
+    for word in words:
+        anagrams.setdefault(word_key(word), []).append(word)
+        count += 1
+
+    slots = 1
+    while slots < 2 * len(anagrams):
+        slots *= 2
+    table = [EMPTY] * slots
+    entries = bytearray()
+    base = HEADER.size + SLOT.size * slots
+    for key in sorted(anagrams):
+        slot = zlib.crc32(key.encode()) & (slots - 1)
+        while table[slot] != EMPTY:
+            slot = (slot + 1) & (slots - 1)
+        table[slot] = base + len(entries)
+
+        entries.append(len(key))
+        entries += key.encode()
+        group = sorted(anagrams[key])
+        entries += struct.pack('<H', len(group))
+        for word in group:
+            entries.append(len(word))
+            entries += word.encode()
+
+    with write_index(path) as f:
+        f.write(HEADER.pack(MAGIC, VERSION, slots, len(anagrams), count))
+        f.write(struct.pack(f'<{slots}I', *table))
+        f.write(entries)
+    return len(anagrams)
+
+
+class WordIndex(MappedIndex):
+    """An index file written by build_index() (see MappedIndex)."""
+    MAGIC = MAGIC
+    VERSION = VERSION
+    HEADER = HEADER
+    DEFAULT_PATH = DEFAULT_PATH
+    NAME = 'a word index'
+
+    def _read_header(self, fields):
+        self.__slots, self.key_count, self.word_count = fields
+        return True
+
+    def anagrams(self, letters):
+        """Returns the words that use exactly the given letters, in
+        any order, as a list (empty if there are none)."""
+        key = word_key(letters).encode()
+        data = self._map
+        mask = self.__slots - 1
+        slot = zlib.crc32(key) & mask
+        while True:
+            (offset,) = SLOT.unpack_from(data, HEADER.size + SLOT.size * slot)
+            if offset == EMPTY:
+                return []
+            length = data[offset]
+            if data[offset + 1:offset + 1 + length] == key:
+                break
+            slot = (slot + 1) & mask
+
+        offset += 1 + length
+        (count,) = struct.unpack_from('<H', data, offset)
+        offset += 2
+        words = []
+        for _ in range(count):
+            length = data[offset]
+            words.append(data[offset + 1:offset + 1 + length].decode())
+            offset += 1 + length
+        return words
+
+    def solve(self, tiles, count=10):
+        """Returns the longest words that can be made from {tiles} (a
+        string or a list of letters), each tile used at most once. The
+        words come longest first, and in alphabetical order for the same
+        length. The search stops at the length where at least {count}
+        words have been found, but all words of that length are given.
+        """
+        letters = sorted(word_key(''.join(tiles)))
+        words = []
+        for length in range(len(letters), 1, -1):
+            found = set()
+            for key in set(itertools.combinations(letters, length)):
+                found.update(self.anagrams(''.join(key)))
+            words.extend(sorted(found))
+            if len(words) >= count:
+                break
+        return words
+
+
+def main():
+    logging.basicConfig()
+    words_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_WORDS
+    path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_PATH
+    count = build_index(read_words(words_path), path)
+    logger.info('Wrote %d keys to %s', count, path)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,8 +1,17 @@
+import argparse
+import bisect
 import logging
+import math
 import random
 import time
-from tkinter import HORIZONTAL
-from breezypythongui import EasyFrame, EasyCanvas
+from tkinter import DISABLED, HORIZONTAL, NORMAL
+from breezypythongui import Animation, EasyFrame, EasyCanvas
+from conundrum import ConundrumIndex
+from letters import TILES, WordIndex, allowed_kinds, draw_letter
+from reachability import ReachabilityIndex
+from roundlog import Round, RoundLog, read_rounds
+from rules import HIGHEST_TARGET, LOWEST_TARGET
+from solver import SolutionStream, solve
 
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -22,105 +31,338 @@ class CountdownGui(EasyFrame):
     six numbers are selected.
 
     By pressing the yellow button, a new number can be selected.
+
+    The Conundrum button shows a scrambled nine-letter word on the big
+    display instead; pressing it again reveals the answer. The puzzles
+    come from the conundrum index (see conundrum.py).
+
+    Every round has its own seed, drawn from the RNG seeded with {seed}.
+    If {log_path} is given, every round is appended to that round log
+    (see roundlog.py), and replay() can play the rounds again later.
     """
     NUMBERS = {
         'small': [1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 8, 8, 9, 9, 10, 10],
         'big': [25, 50, 75, 100],
     }
+    ROLL_FRAMES = 25  # The number of random numbers drawn per roll
+    ROLL_DURATION = 1750  # The duration of a roll in ms
+    FRAME_INTERVAL = 16  # The time between the frames of a roll in ms
+    POLL_INTERVAL = 30  # How often new solutions are shown, in ms
 
-    def __init__(self):
-        EasyFrame.__init__(self, title="Countdown")
+    BIG_OPTIONS = ['4 Big', '3 Big', '2 Big', '1 Big', 'All small']
 
-        self.canvas = self.addCanvas(row=0, column=0,
-                                     columnspan=6,
-                                     width=450,
-                                     height=200)
-        self.canvas.drawRectangle(2, 2, 451, 201,
-                                  outline="white",
-                                  fill="black")
-
-        self.__show_bignum('---')
-        self.addCanvas(canvas=RedButton(self, on_click=self.create_random_bignum),
-                       row=1, column=6)
+    def __init__(self, seed=None, log_path=None):
+        EasyFrame.__init__(self, title="Countdown")
 
+        self.__rng = random.Random(seed)
+        self.__round = None  # The seed, big count and start time of the round
+        self.__rolls = 0  # The number of rolls started in the round so far
+        self.__roll_number = 0  # The number of the roll in progress
+        self.__roll_rng = None
+        self.__replaying = False
+        self.__log = RoundLog(log_path) if log_path else None
+        self.__roll_start = None
+        self.last_round = None  # The Round of the last roll that finished
+
+        self.__sample = None
+        # The roll shows a new number ever less often: the number of
+        # numbers drawn grows with the square root of the time
+        self.__roll = Animation(self, self.ROLL_DURATION, self.__roll_to, easing=math.sqrt,
+                                frameInterval=self.FRAME_INTERVAL)
+        self.__roll_drawn = 0
+        self.__bignum_items = []
+        self.__conundrum_item = None
+        self.__conundrum = None  # The answer of the conundrum that is shown
+        self.__conundrums = ConundrumIndex.open_default()
+        # Maps the precomputed index if it has been built
+        self.__index = ReachabilityIndex.open_default()
         self.__nums = []
-        for x in range(6):
-            canvas = self.addCanvas(row=1, column=x,
-                                    width=70,
-                                    height=50)
-            canvas.drawRectangle(0, 0, 69, 49,
-                                 outline="black",
-                                 fill="white")
-            canvas.drawText('-', 32, 28, font=("Arial", 36, 'bold'), tag=f'num-{x}')
-            self.__nums.append(canvas)
-
-        self.group = self.addRadiobuttonGroup(row=2, column=0, columnspan=6, rowspan=1,
-                                              orient=HORIZONTAL)
-        self.group.addRadiobutton('4 Big')
-        self.group.addRadiobutton('3 Big')
-        default = self.group.addRadiobutton('2 Big')
-        self.group.addRadiobutton('1 Big')
-        self.group.addRadiobutton('All small')
-
-        self.group.setSelectedButton(default)
-
-        self.addButton("Play", row=3, column=0, columnspan=6, rowspan=2, command=self.play)
-
-    def __show_bignum(self, num):
+        self.__num_items = []
+        self.__solution_lengths = []
+        self.__stream = None
+        self.__poll_job = None
+
+        # The grid is laid out in one go when the block ends
+        with self.layout():
+            self.canvas = self.addCanvas(row=0, column=0,
+                                         columnspan=6,
+                                         width=450,
+                                         height=200)
+            self.canvas.drawRectangle(2, 2, 451, 201,
+                                      outline="white",
+                                      fill="black")
+            self.show_bignum('---')
+            self.addCanvas(canvas=RedButton(self, on_click=self.create_random_bignum),
+                           row=1, column=6)
+
+            for x in range(6):
+                canvas = self.addCanvas(row=1, column=x,
+                                        width=70,
+                                        height=50)
+                canvas.drawRectangle(0, 0, 69, 49,
+                                     outline="black",
+                                     fill="white")
+                item = canvas.drawText('-', 32, 28, font=("Arial", 36, 'bold'), tag=f'num-{x}')
+                self.__nums.append(canvas)
+                self.__num_items.append(item)
+
+            self.group = self.addRadiobuttonGroup(row=2, column=0, columnspan=6, rowspan=1,
+                                                  orient=HORIZONTAL)
+            self.__big_buttons = [self.group.addRadiobutton(text) for text in self.BIG_OPTIONS]
+            self.group.setSelectedButton(self.__big_buttons[2])  # 2 Big
+
+            self.addButton("Play", row=3, column=0, columnspan=6, rowspan=2, command=self.play)
+            self.addButton("Conundrum", row=3, column=6, command=self.conundrum,
+                           state=NORMAL if self.__conundrums else DISABLED)
+
+            # The solutions of the round, shortest first
+            self.solutions = self.addListbox(row=5, column=0, columnspan=7, width=40, height=6)
+
+    def show_bignum(self, num):
         """This method draws a Big Number on the canvas. It splits
         the number into three digits. Each is shown separately on
-        the canvas.
+        the canvas. The items are created the first time, and
+        updated in place after that.
 
         Technically it takes a string of length >= 3. This is not
         checked, so the caller must make sure this is the case.
         """
-        fill = 'lightgreen'
-        font = ("Courier", 150, 'bold')
+        self.__hide_conundrum()
+        if not self.__bignum_items:
+            fill = 'lightgreen'
+            font = ("Courier", 150, 'bold')
+            for x in range(3):
+                self.__bignum_items.append(
+                    self.canvas.drawText(num[x], 75 + 150 * x, 100, font=font,
+                                         tag=f'bignum-{x}', fill=fill))
+            return
+
         for x in range(3):
-            self.canvas.delete(f'bignum-{x}')
-            self.canvas.drawText(num[x], 75 + 150 * x, 100, font=font,
-                                 tag=f'bignum-{x}', fill=fill)
+            self.canvas.setText(self.__bignum_items[x], text=num[x])
+
+    def conundrum(self):
+        """This method shows a new conundrum: a scrambled nine-letter word,
+        on the big display. If a conundrum is being shown, its answer is
+        revealed instead.
+        """
+        if not self.__conundrums:
+            return
+        if self.__conundrum:
+            self.__show_conundrum(self.__conundrum.upper(), 'gold')
+            self.__conundrum = None
+            return
+
+        self.cancel_roll()
+        self.__cancel_solutions()
+        scrambled, self.__conundrum = self.__conundrums.pick(self.__rng)
+        logger.info('Conundrum: %s', scrambled)
+        self.__show_conundrum(scrambled.upper(), 'lightgreen')
+
+    def __show_conundrum(self, word, fill):
+        """This method shows {word} on the canvas, in place of the Big
+        Number. The text item is created the first time.
+        """
+        for item in self.__bignum_items:
+            self.canvas.setText(item, text='')
+        if self.__conundrum_item is None:
+            self.__conundrum_item = self.canvas.drawText(word, 226, 100, font=("Courier", 54, 'bold'),
+                                                         tag='conundrum', fill=fill)
+        else:
+            self.canvas.setText(self.__conundrum_item, text=word, fill=fill)
+
+    def __hide_conundrum(self):
+        """This method removes the conundrum from the canvas, if any."""
+        self.__conundrum = None
+        if self.__conundrum_item is not None:
+            self.canvas.setText(self.__conundrum_item, text='')
 
     def create_random_bignum(self):
-        """Create a random number and show it as a Big Number.
-        If a guess is provided, it is simply shown. If no guess
-        is provided, the program will randomly select one,
+        """Create a random number and show it as a Big Number,
         while showing the selection process. It shows numbers
-        really quickly while slowing down over 2-3 seconds.
+        really quickly while slowing down over ROLL_DURATION.
+
+        The roll is an Animation, so it never blocks the event
+        loop, and it takes the same time however slow the display
+        is. Calling this method while a roll is in progress
+        restarts the roll. While replaying, the roll ends at once.
         """
-        timeout = 0.0
-        for x in range(25):
-            time.sleep(timeout)
-            if x % 5 == 0:
-                timeout += 0.025
+        self.cancel_roll()
+        self.__cancel_solutions()
 
-            # Get a new random number
-            guess = random.randint(100, 999)
-            self.__show_bignum(str(guess))
+        # Every roll has its own RNG, so that it can be replayed. A roll
+        # that is restarted gets the next number, and so a new target
+        if self.__round:
+            seed = self.__round[0]
+        else:
+            seed = self.__rng.getrandbits(64)
+        self.__roll_number = self.__rolls % 256
+        self.__rolls += 1
+        self.__roll_rng = random.Random(seed << 8 | self.__roll_number)
+        self.__roll_start = time.perf_counter()
+        self.__roll_drawn = 0
+
+        if self.__replaying:
+            self.__roll_to(1.0)
+        else:
+            self.__roll.start()
 
-            # Make sure the display updates
-            self.update()
+    def cancel_roll(self):
+        """This method stops the roll that is in progress, if any.
+        The number that is currently shown stays on the display.
+        """
+        self.__roll.stop()
+
+    def is_rolling(self):
+        """This method returns True while a roll is in progress."""
+        return self.__roll.isRunning()
+
+    @property
+    def roll_animation(self):
+        """The Animation of the roll. Its statistics describe the last
+        roll (see Animation.stats)."""
+        return self.__roll
+
+    def __roll_to(self, progress):
+        """This method shows the roll at {progress}, from 0.0 to 1.0: the
+        last of the random numbers that are due by then. The numbers of
+        dropped frames are still drawn, so that the target only depends
+        on the seed. At 1.0, the last number is the target of the round.
+        """
+        due = 1 + int(progress * (self.ROLL_FRAMES - 1))
+        if due <= self.__roll_drawn:
+            return
+        while self.__roll_drawn < due:
+            guess = self.__roll_rng.randint(LOWEST_TARGET, HIGHEST_TARGET)
+            self.__roll_drawn += 1
+        self.show_bignum(str(guess))
+
+        if due == self.ROLL_FRAMES:
+            self.__log_round(guess)
+            if not self.__replaying:
+                self.__find_solutions(guess)
+
+    def __log_round(self, target):
+        """This method writes the round that ended with {target} to the
+        round log, if there is one and numbers have been dealt. Replayed
+        rounds are not written again.
+        """
+        roll_ms = (time.perf_counter() - self.__roll_start) * 1000
+        if self.__round:
+            seed, big, play_ms = self.__round
+            self.last_round = Round(seed, self.__roll_number, big, tuple(self.__sample),
+                                    target, play_ms, roll_ms)
+            if self.__log and not self.__replaying:
+                self.__log.append(self.last_round)
+
+    def __find_solutions(self, target):
+        """This method starts looking for all the ways to reach {target}
+        with the numbers that were dealt by play(). The search runs in a
+        background thread, and the solutions are added to the list as
+        they are found. Nothing happens if no numbers have been dealt yet.
+        """
+        self.__cancel_solutions()
+        if not self.__sample:
+            return
+        self.__stream = SolutionStream(self.__sample, target)
+        self.__poll_job = self.after(self.POLL_INTERVAL, self.__poll_solutions)
+
+    def __poll_solutions(self):
+        """This method shows the solutions that were found since the
+        last time, and checks again later until the search is done.
+        """
+        self.__poll_job = None
+        stream = self.__stream
+        finished = stream.finished
+        batch = stream.take()
+        if batch:
+            if not self.__solution_lengths:
+                logger.info('Solution for %d: %s', stream.target, batch[0])
+            self.__add_solutions(batch)
+
+        if not finished:
+            self.__poll_job = self.after(self.POLL_INTERVAL, self.__poll_solutions)
+        elif stream.closest:
+            closest = stream.closest
+            logger.info('No solution for %d. Closest is %d: %s',
+                        stream.target, closest.value, closest.expression)
+            self.solutions.insert(0, f'No solution. Closest: {closest.expression} = {closest.value}')
+        else:
+            logger.info('Found %d solutions for %d', len(self.__solution_lengths), stream.target)
 
-    def get_random_selection(self, big, total=6):
+    def __add_solutions(self, batch):
+        """This method adds a batch of solutions to the list, keeping
+        the list ordered by the length of the expressions.
+        """
+        batch.sort(key=len)
+        lengths = self.__solution_lengths
+        if not lengths or len(batch[0]) >= lengths[-1]:
+            # The usual case: longer solutions are found later
+            self.solutions.extend(batch)
+            lengths.extend(len(expression) for expression in batch)
+            return
+
+        for expression in batch:
+            index = bisect.bisect_right(lengths, len(expression))
+            lengths.insert(index, len(expression))
+            self.solutions.insert(index, expression)
+
+    def __cancel_solutions(self):
+        """This method stops the search for solutions, if any, and
+        clears the list.
+        """
+        if self.__stream:
+            self.__stream.cancel()
+            self.__stream = None
+        if self.__poll_job is not None:
+            self.after_cancel(self.__poll_job)
+            self.__poll_job = None
+        self.solutions.clear()
+        self.__solution_lengths = []
+
+    def is_solvable(self, target):
+        """This method checks whether {target} can be made exactly with
+        the numbers that were dealt by play(). It uses the precomputed
+        index (see reachability.py) when it is available, which makes
+        this a lookup instead of a search. Without the index, solve()
+        builds the values of the deal once, in about 20 ms (up to about
+        50 ms) on the Tk thread, unless the search for solutions of the
+        round already did so in its thread; every later call for the
+        same deal is a lookup.
+        """
+        if not self.__sample:
+            return False
+        if self.__index:
+            return self.__index.is_solvable(self.__sample, target)
+        return solve(self.__sample, target).exact
+
+    def get_random_selection(self, big, total=6, rng=random):
         """This method gets a random selection of numbers from the
         available numbers. The number of "big numbers" must be
         provided as the argument {big}. The parameter {total} is
         optional and set 6 by default (the actual number for the
-        official Countdown game.
+        official Countdown game. The numbers are drawn with {rng},
+        the random module by default.
         """
         assert total - big >= 0
 
-        big_numbers = random.sample(self.NUMBERS['big'], big)
-        small_numbers = random.sample(self.NUMBERS['small'], total - big)
+        big_numbers = rng.sample(self.NUMBERS['big'], big)
+        small_numbers = rng.sample(self.NUMBERS['small'], total - big)
         return big_numbers + small_numbers
 
-    def play(self):
+    def play(self, seed=None):
         """This method starts a round. It sets the "big number" in the display
         to --- to indicate a new round has started. It selects a number of
         random numbers based on the selected RadioButton. The player can
         choose between 0 and 4 big numbers. The rest will be small numbers.
+        The numbers are drawn with the seed of the round: {seed}, or a new
+        one from the RNG of the game.
         """
-        self.__show_bignum('---')
+        start = time.perf_counter()
+        if seed is None:
+            seed = self.__rng.getrandbits(64)
+        self.cancel_roll()
+        self.__cancel_solutions()
+        self.show_bignum('---')
 
         # Get the selected value from the Button Group
         value = self.group.getSelectedButton()['value'][0]
@@ -130,11 +372,147 @@ class CountdownGui(EasyFrame):
             big = int(value)  # The number of "big numbers"
 
         # Get the random selection and update the display
-        sample = self.get_random_selection(big)
+        sample = self.get_random_selection(big, rng=random.Random(seed))
+        self.__sample = sample
         for x in range(6):
-            canvas = self.__nums[x]
-            canvas.delete(f'num-{x}')
-            canvas.drawText(str(sample[x]), 32, 28, font=("Arial", 36, 'bold'), tag=f'num-{x}')
+            self.__nums[x].setText(self.__num_items[x], text=str(sample[x]))
+
+        self.__rolls = 0
+        self.__round = (seed, big, (time.perf_counter() - start) * 1000)
+
+    def replay(self, path):
+        """This method plays the rounds in the round log at {path} again,
+        without the delays of the roll. Each round is dealt from its seed
+        with the same number of big numbers, and rolled as often as it was
+        before. Returns a list of (logged, replayed) pairs of Rounds; the
+        tiles and targets of each pair are the same unless the code has
+        changed.
+        """
+        results = []
+        self.__replaying = True
+        try:
+            for logged in read_rounds(path):
+                self.group.setSelectedButton(self.__big_buttons[4 - logged.big])
+                self.play(seed=logged.seed)
+                self.__rolls = logged.roll
+                self.create_random_bignum()
+                self.update_idletasks()
+                results.append((logged, self.last_round))
+        finally:
+            self.__replaying = False
+        return results
+
+    def destroy(self):
+        """This method stops the roll and the search for solutions
+        when the window is closed.
+        """
+        self.cancel_roll()
+        self.__cancel_solutions()
+        if self.__log:
+            self.__log.close()
+        if self.__conundrums:
+            self.__conundrums.close()
+        if self.__index:
+            self.__index.close()
+        EasyFrame.destroy(self)
+
+
+class LettersGui(EasyFrame):
+    """The LettersGui class creates a visual representation of the
+    Letters game of Countdown. The player picks nine tiles, one at a
+    time, from the vowel pile or the consonant pile. At least three
+    vowels and four consonants must be picked; the buttons are disabled
+    when a pick would break that rule.
+
+    When all tiles are picked, the longest words that can be made with
+    them are shown. The words are looked up in the word index (see
+    letters.py), which must have been built beforehand.
+    """
+
+    def __init__(self, seed=None):
+        EasyFrame.__init__(self, title="Countdown - Letters")
+
+        self.__rng = random.Random(seed)
+        self.__index = WordIndex.open_default()
+        self.__tiles = []
+
+        self.__tile_canvases = []
+        self.__tile_items = []
+        with self.layout():
+            for x in range(TILES):
+                canvas = self.addCanvas(row=0, column=x,
+                                        width=50,
+                                        height=50)
+                canvas.drawRectangle(0, 0, 49, 49,
+                                     outline="white",
+                                     fill="#1d3f8f")
+                item = canvas.drawText('', 25, 27, font=("Arial", 28, 'bold'), fill='white',
+                                       tag=f'tile-{x}')
+                self.__tile_canvases.append(canvas)
+                self.__tile_items.append(item)
+
+            self.__buttons = {
+                'vowel': self.addButton("Vowel", row=1, column=0, columnspan=3,
+                                        command=lambda: self.pick('vowel')),
+                'consonant': self.addButton("Consonant", row=1, column=3, columnspan=3,
+                                            command=lambda: self.pick('consonant')),
+            }
+            self.addButton("New round", row=1, column=6, columnspan=3, command=self.new_round)
+
+            # The longest words, longest first
+            self.words = self.addListbox(row=2, column=0, columnspan=9, width=40, height=8)
+
+    def pick(self, kind):
+        """This method draws a tile from the pile {kind}, 'vowel' or
+        'consonant', and shows it. After the last tile, the round is
+        solved. Nothing happens if the pick is not allowed.
+        """
+        if kind not in allowed_kinds(self.__tiles):
+            return
+        letter = draw_letter(kind, self.__rng)
+        x = len(self.__tiles)
+        self.__tiles.append(letter)
+        self.__tile_canvases[x].setText(self.__tile_items[x], text=letter)
+        self.__update_buttons()
+        if len(self.__tiles) == TILES:
+            self.__solve()
+
+    def new_round(self):
+        """This method clears the tiles and the words for a new round."""
+        self.__tiles = []
+        for canvas, item in zip(self.__tile_canvases, self.__tile_items):
+            canvas.setText(item, text='')
+        self.words.clear()
+        self.__update_buttons()
+
+    def __update_buttons(self):
+        """This method enables the buttons of the piles that may be
+        picked from, and disables the others.
+        """
+        kinds = allowed_kinds(self.__tiles)
+        for kind, button in self.__buttons.items():
+            button['state'] = NORMAL if kind in kinds else DISABLED
+
+    def __solve(self):
+        """This method shows the longest words that can be made with
+        the tiles.
+        """
+        if not self.__index:
+            self.words.setItems(['No word index. Build it with: python letters.py <word list>'])
+            return
+        start = time.perf_counter()
+        words = self.__index.solve(self.__tiles)
+        logger.info('Solved %s in %.2fms', ''.join(self.__tiles), (time.perf_counter() - start) * 1000)
+        if words:
+            self.words.setItems([f'{len(word)}: {word.upper()}' for word in words])
+        else:
+            self.words.setItems(['No words'])
+
+    def destroy(self):
+        """This method closes the word index when the window is closed."""
+        if self.__index:
+            self.__index.close()
+        EasyFrame.destroy(self)
 
 
 class RedButton(EasyCanvas):
@@ -157,7 +535,27 @@ class RedButton(EasyCanvas):
 
 
 def main():
-    countdown_gui = CountdownGui()
+    parser = argparse.ArgumentParser(description='The Numbers and Letters games of Countdown')
+    parser.add_argument('--round', choices=['numbers', 'letters'], default='numbers',
+                        help='the round to play')
+    parser.add_argument('--seed', type=int, help='seed for the random numbers')
+    parser.add_argument('--log', help='append every round to this round log')
+    parser.add_argument('--replay', help='replay the rounds in this round log and exit')
+    args = parser.parse_args()
+    if args.log and args.replay:
+        parser.error('--log cannot be used with --replay')
+
+    if args.round == 'letters':
+        LettersGui(seed=args.seed).mainloop()
+        return
+    countdown_gui = CountdownGui(seed=args.seed, log_path=args.log)
+    if args.replay:
+        results = countdown_gui.replay(args.replay)
+        differences = sum(1 for logged, replayed in results
+                          if (logged.tiles, logged.target) != (replayed.tiles, replayed.target))
+        logger.warning('Replayed %d rounds, %d differ from the log', len(results), differences)
+        countdown_gui.master.destroy()
+        return
     countdown_gui.mainloop()
 
 
@@ -0,0 +1,82 @@
+"""The parts shared by the index files that are built once, offline,
+and memory-mapped at runtime: the reachability index
+(reachability.py), the word index (letters.py) and the conundrum
+index (conundrum.py).
+
+Every index file starts with a header that begins with a magic and a
+version. An index is written to a temporary file first and then moved
+into place, so a build that fails leaves the old index untouched.
+"""
+import contextlib
+import mmap
+import os
+import struct
+
+
+@contextlib.contextmanager
+def write_index(path):
+    """Opens a temporary file next to {path} for writing, and moves it
+    to {path} when the block ends. If the block raises, the temporary
+    file is removed and {path} is left as it was."""
+    temp_path = path + '.tmp'
+    try:
+        with open(temp_path, 'wb') as f:
+            yield f
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.remove(temp_path)
+        raise
+    os.replace(temp_path, path)
+
+
+class MappedIndex:
+    """A memory-mapped, read-only view of an index file. Only the header
+    is read when it is opened; the operating system pages in the rest
+    as lookups need it.
+
+    Subclasses set MAGIC, VERSION, HEADER (a struct.Struct that starts
+    with the magic and the version), DEFAULT_PATH and NAME, and read
+    the other fields of the header in _read_header().
+    """
+    MAGIC = None
+    VERSION = None
+    HEADER = None
+    DEFAULT_PATH = None
+    NAME = 'index'  # What the file is, for the error message
+
+    def __init__(self, path=None):
+        if path is None:
+            path = self.DEFAULT_PATH
+        with open(path, 'rb') as f:
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            magic, version, *fields = self.HEADER.unpack_from(self._map, 0)
+            valid = magic == self.MAGIC and version == self.VERSION and self._read_header(fields)
+        except struct.error:
+            valid = False
+        if not valid:
+            self.close()
+            raise ValueError(f'{path} is not {self.NAME}')
+
+    def _read_header(self, fields):
+        """Reads the fields of the header after the magic and the
+        version. Returns False if they do not describe a valid index."""
+        return True
+
+    @classmethod
+    def open_default(cls):
+        """Returns the index at DEFAULT_PATH, or None if it has not
+        been built."""
+        if not os.path.exists(cls.DEFAULT_PATH):
+            return None
+        return cls(cls.DEFAULT_PATH)
+
+    def close(self):
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
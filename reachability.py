@@ -0,0 +1,189 @@
+"""Precomputed index of the targets that can be reached with every deal.
+
+The tiles in CountdownGui.NUMBERS make up a small, finite set of
+distinct six-tile deals (13243 for 0 - 4 big numbers). For each of
+these, the index stores a bitset of the targets 100 - 999 that can be
+made exactly. The index is built once, offline, with
+
+    python reachability.py [path]
+
+At runtime the file is memory-mapped instead of loaded, and checking
+whether a round is solvable is an O(1) lookup without any search.
+
+File layout (all integers little-endian):
+
+    header    magic, version, number of tile kinds K, number of
+              deals D, lowest and highest target, bytes per bitset B
+    tiles     K x uint16: the distinct tile values, ascending
+    limits    K x uint8: how often each tile occurs in the pool
+    slots     one uint16 per combination of tile counts (the counts
+              are read as a mixed-radix number); the number of the
+              deal's bitset, or 0xFFFF if there is no such deal
+    bitsets   D x B bytes; bit (target - lowest) is set if the
+              target can be reached
+"""
+import itertools
+import logging
+import os
+import struct
+import sys
+import time
+
+from mappedindex import MappedIndex, write_index
+from rules import HIGHEST_TARGET, LOWEST_TARGET
+from solver import parallel_map, reachable
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+MAGIC = b'CDRI'
+VERSION = 1
+HEADER = struct.Struct('<4sHHIHHH')
+NO_DEAL = 0xFFFF
+
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'reachability.idx')
+
+
+def deals(numbers, total=6):
+    """Yields every distinct deal (a sorted tuple of {total} tiles)
+    that CountdownGui.get_random_selection can make from the pool
+    {numbers}, for every possible number of big numbers.
+    """
+    seen = set()
+    for big in range(min(total, len(numbers['big'])) + 1):
+        for big_numbers in itertools.combinations(numbers['big'], big):
+            for small_numbers in itertools.combinations(numbers['small'], total - big):
+                deal = tuple(sorted(big_numbers + small_numbers))
+                if deal not in seen:
+                    seen.add(deal)
+                    yield deal
+
+
+def _slot(deal, tiles, limits):
+    """Returns the position of {deal} in the slot table, or -1 if the
+    deal cannot be made from the tiles."""
+    slot = 0
+    for tile, limit in zip(tiles, limits):
+        count = deal.count(tile)
+        if count > limit:
+            return -1
+        slot = slot * (limit + 1) + count
+    if len(deal) != sum(deal.count(tile) for tile in tiles):
+        return -1
+    return slot
+
+
+def _bitset(deal, lowest, highest):
+    """Returns the bitset of the targets from {lowest} to {highest}
+    that can be made with {deal}."""
+    bitset = bytearray((highest - lowest) // 8 + 1)
+    for value in reachable(deal):
+        if lowest <= value <= highest:
+            bit = value - lowest
+            bitset[bit // 8] |= 1 << (bit % 8)
+    return bitset
+
+
+def build_index(numbers, path=DEFAULT_PATH, lowest=LOWEST_TARGET, highest=HIGHEST_TARGET,
+                workers=None):
+    """Builds the index for the pool {numbers} (a dict like
+    CountdownGui.NUMBERS) and writes it to {path}. This runs a full
+    search for every deal, spread over {workers} processes (one per
+    CPU by default), so it takes a while. Returns the number of deals
+    in the index.
+    """
+    pool = numbers['small'] + numbers['big']
+    tiles = sorted(set(pool))
+    limits = [pool.count(tile) for tile in tiles]
+    slots = 1
+    for limit in limits:
+        slots *= limit + 1
+    width = (highest - lowest) // 8 + 1
+
+    all_deals = list(deals(numbers))
+    if len(all_deals) >= NO_DEAL:
+        raise ValueError('Too many deals for the index format')
+
+    table = [NO_DEAL] * slots
+    bitsets = bytearray()
+    start = time.perf_counter()
+    jobs = ((deal, lowest, highest) for deal in all_deals)
+    for number, bitset in enumerate(parallel_map(_bitset, jobs, workers, chunksize=16)):
+        table[_slot(all_deals[number], tiles, limits)] = number
+        bitsets += bitset
+        if number % 1000 == 0:
+            logger.info('Indexed %d of %d deals in %.0fs',
+                        number, len(all_deals), time.perf_counter() - start)
+
+    with write_index(path) as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(tiles), len(all_deals), lowest, highest, width))
+        f.write(struct.pack(f'<{len(tiles)}H', *tiles))
+        f.write(struct.pack(f'<{len(tiles)}B', *limits))
+        f.write(struct.pack(f'<{slots}H', *table))
+        f.write(bitsets)
+    return len(all_deals)
+
+
+class ReachabilityIndex(MappedIndex):
+    """An index file written by build_index() (see MappedIndex)."""
+    MAGIC = MAGIC
+    VERSION = VERSION
+    HEADER = HEADER
+    DEFAULT_PATH = DEFAULT_PATH
+    NAME = 'a reachability index'
+
+    def _read_header(self, fields):
+        kinds, self.deal_count, self.lowest, self.highest, self.__width = fields
+        offset = HEADER.size
+        self.__tiles = struct.unpack_from(f'<{kinds}H', self._map, offset)
+        offset += 2 * kinds
+        self.__limits = struct.unpack_from(f'<{kinds}B', self._map, offset)
+        offset += kinds
+        self.__table_offset = offset
+        slots = 1
+        for limit in self.__limits:
+            slots *= limit + 1
+        self.__bitsets_offset = offset + 2 * slots
+        return True
+
+    def __bitset_offset(self, tiles):
+        """Returns the file offset of the bitset for {tiles}.
+        Raises: KeyError if the deal is not in the index."""
+        slot = _slot(tuple(tiles), self.__tiles, self.__limits)
+        if slot >= 0:
+            (number,) = struct.unpack_from('<H', self._map, self.__table_offset + 2 * slot)
+            if number != NO_DEAL:
+                return self.__bitsets_offset + number * self.__width
+        raise KeyError(f'No deal {tuple(tiles)} in the index')
+
+    def is_solvable(self, tiles, target):
+        """Returns True if {target} can be made exactly with {tiles}.
+        Raises: KeyError if the deal is not in the index, and
+        ValueError if the target is out of range."""
+        if not self.lowest <= target <= self.highest:
+            raise ValueError(f'Target must be between {self.lowest} and {self.highest}')
+        bit = target - self.lowest
+        return bool(self._map[self.__bitset_offset(tiles) + bit // 8] & (1 << (bit % 8)))
+
+    def solvable_targets(self, tiles):
+        """Returns a list of all targets that can be made exactly
+        with {tiles}.
+        Raises: KeyError if the deal is not in the index."""
+        offset = self.__bitset_offset(tiles)
+        bitset = self._map[offset:offset + self.__width]
+        return [self.lowest + bit
+                for bit in range(self.highest - self.lowest + 1)
+                if bitset[bit // 8] & (1 << (bit % 8))]
+
+
+def main():
+    from main import CountdownGui
+
+    logging.basicConfig()
+    path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_PATH
+    count = build_index(CountdownGui.NUMBERS, path)
+    logger.info('Wrote %d deals to %s', count, path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Compact, append-only binary log of the rounds played in CountdownGui.
+
+Every round that ends with a target is written as one fixed-size
+record of 32 bytes. With the seed of the round, CountdownGui.replay()
+can play the round again exactly: the same tiles and the same target.
+
+File layout (all integers little-endian):
+
+    header    8 bytes: magic and version
+    records   one per round:
+              seed      uint64   the seed of the round
+              roll      uint8    which roll of the round this was
+              big       uint8    the number of big numbers chosen
+              tiles     6 x uint16
+              target    uint16
+              play_ms   float32  the time taken by play()
+              roll_ms   float32  the time from the start of the roll
+                                 until the target was shown
+"""
+import collections
+import os
+import struct
+
+MAGIC = b'CDRL'
+VERSION = 1
+HEADER = struct.Struct('<4sI')
+RECORD = struct.Struct('<QBB6HHff')
+
+Round = collections.namedtuple('Round', 'seed roll big tiles target play_ms roll_ms')
+
+
+class RoundLog:
+    """Appends rounds to a log file. Every round is flushed as soon
+    as it is written, so a crash loses at most the record that was
+    being written. That partial record is dropped when the log is
+    opened again, so the records that follow it stay aligned."""
+
+    def __init__(self, path):
+        self.path = path
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            _check_header(path)
+            self.__file = open(path, 'r+b')
+            records = (os.path.getsize(path) - HEADER.size) // RECORD.size
+            self.__file.truncate(HEADER.size + records * RECORD.size)
+            self.__file.seek(0, os.SEEK_END)
+        else:
+            self.__file = open(path, 'wb')
+            self.__file.write(HEADER.pack(MAGIC, VERSION))
+
+    def append(self, round_):
+        """Writes {round_} (a Round) at the end of the log."""
+        self.__file.write(RECORD.pack(round_.seed, round_.roll, round_.big, *round_.tiles,
+                                      round_.target, round_.play_ms, round_.roll_ms))
+        self.__file.flush()
+
+    def close(self):
+        self.__file.close()
+
+
+def _check_header(path):
+    with open(path, 'rb') as f:
+        header = f.read(HEADER.size)
+    if len(header) < HEADER.size or HEADER.unpack(header) != (MAGIC, VERSION):
+        raise ValueError(f'{path} is not a round log')
+
+
+def read_rounds(path):
+    """Yields the Rounds in the log at {path}, in the order they were
+    played. A record that was cut short at the end is ignored."""
+    _check_header(path)
+    with open(path, 'rb') as f:
+        f.seek(HEADER.size)
+        while True:
+            data = f.read(RECORD.size * 4096)
+            usable = len(data) - len(data) % RECORD.size
+            for values in RECORD.iter_unpack(data[:usable]):
+                seed, roll, big = values[:3]
+                target, play_ms, roll_ms = values[9:]
+                yield Round(seed, roll, big, values[3:9], target, play_ms, roll_ms)
+            if len(data) < RECORD.size * 4096:
+                return
@@ -0,0 +1,64 @@
+"""Bulk generation of Countdown rounds for simulations.
+
+CountdownGui deals one round at a time with random.sample. For
+simulations that need millions of rounds, deal_rounds() deals them
+all at once with NumPy: the deals come back as an (N, 6) array and
+the targets as an (N,) array.
+
+The deals follow the same rules as CountdownGui.get_random_selection:
+the tiles are drawn without replacement from the pool, so there are at
+most two of each small number and at most one of each big number. The
+big numbers come first in each deal.
+
+The output is fully determined by the seed: the same seed and
+arguments give the same arrays, bit for bit.
+
+This module requires NumPy, which the GUI itself does not need.
+"""
+import numpy as np
+
+from rules import HIGHEST_TARGET, LOWEST_TARGET
+
+
+def deal_rounds(count, big=None, seed=None, numbers=None, total=6):
+    """Deals {count} rounds. Returns a pair (deals, targets): an int16
+    array of shape (count, total) and an int16 array of shape (count,).
+
+    {big} is the number of big numbers in each deal: an int for all
+    rounds, an array with one per round, or None to choose uniformly
+    between 0 and 4 (the options of the radio group) for every round.
+    {seed} is passed to numpy.random.default_rng. {numbers} is the pool,
+    CountdownGui.NUMBERS by default. Give it explicitly where Tk is not
+    available, as the default imports the GUI.
+    """
+    if numbers is None:
+        from main import CountdownGui
+
+        numbers = CountdownGui.NUMBERS
+    rng = np.random.default_rng(seed)
+    small_pool = np.asarray(numbers['small'], dtype=np.int16)
+    big_pool = np.asarray(numbers['big'], dtype=np.int16)
+    most_big = min(len(big_pool), total)
+
+    if big is None:
+        big = rng.integers(0, most_big, size=count, endpoint=True)
+    big = np.broadcast_to(np.asarray(big, dtype=np.intp), (count,))
+    if big.size and (big.min() < 0 or big.max() > most_big or total - big.min() > len(small_pool)):
+        raise ValueError(f'The number of big numbers must be between {max(0, total - len(small_pool))} '
+                         f'and {most_big}')
+
+    # Shuffling every row of the pools is sampling without replacement;
+    # the first tiles of each shuffled row are the ones dealt
+    small = rng.permuted(np.broadcast_to(small_pool, (count, len(small_pool))), axis=1)
+    big_tiles = rng.permuted(np.broadcast_to(big_pool, (count, len(big_pool))), axis=1)
+    targets = rng.integers(LOWEST_TARGET, HIGHEST_TARGET, size=count,
+                           endpoint=True).astype(np.int16)
+
+    # Column j of a deal is big tile j if j < big, else small tile j - big
+    columns = np.arange(total)
+    is_big = columns < big[:, None]
+    big_tiles = np.pad(big_tiles[:, :most_big], ((0, 0), (0, total - most_big)))
+    small_index = np.clip(columns - big[:, None], 0, len(small_pool) - 1)
+    small = np.take_along_axis(small, small_index, axis=1)
+    deals = np.where(is_big, big_tiles, small)
+    return deals, targets
@@ -0,0 +1,5 @@
+"""The rules of the Numbers round that do not depend on the GUI."""
+
+# The targets are drawn from this range, both ends included
+LOWEST_TARGET = 100
+HIGHEST_TARGET = 999
@@ -0,0 +1,212 @@
+"""Solvability statistics for the options of the big-number radio group.
+
+For every option ("4 Big" through "All small") and every target
+100 - 999, this computes the probability that a deal can reach the
+target exactly, and the average distance from the target to the
+closest result. The numbers are exact, not sampled: every deal that
+CountdownGui.get_random_selection can make is taken into account,
+weighted by how likely it is to be dealt.
+
+The work is shared as much as possible:
+
+- the many ways to draw the same tiles (the two 5s are different
+  tiles in the pool) are collapsed into one multiset with a weight,
+  so each distinct deal is solved once;
+- the values that can be made from a multiset are built bottom-up
+  from the values of its parts, and the parts with up to four tiles
+  are cached, as they are shared by many deals.
+
+Run it with
+
+    python solvability.py [--output solvability.csv] [--workers N]
+
+The result is a CSV file with one row per option and target, ready to
+be charted. It takes a few minutes on one CPU.
+"""
+import argparse
+import array
+import collections
+import csv
+import itertools
+import logging
+import math
+import time
+
+from rules import HIGHEST_TARGET, LOWEST_TARGET
+from solver import parallel_map
+
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+SHARED_SIZE = 4  # The values of multisets up to this size are cached
+
+
+def option_deals(numbers, big, total=6):
+    """Returns a dict that maps every distinct deal (a sorted tuple of
+    {total} tiles) with {big} big numbers to its probability, for the
+    pool {numbers} (a dict like CountdownGui.NUMBERS).
+    """
+    ways = collections.Counter()
+    for big_numbers in itertools.combinations(numbers['big'], big):
+        for small_numbers in itertools.combinations(numbers['small'], total - big):
+            ways[tuple(sorted(big_numbers + small_numbers))] += 1
+    draws = math.comb(len(numbers['big']), big) * math.comb(len(numbers['small']), total - big)
+    return {deal: count / draws for deal, count in ways.items()}
+
+
+class ValueCache:
+    """Computes the values that can be made from multisets of numbers.
+    The values that use all of a multiset are built from the values of
+    every way to split it in two, so the results for small multisets
+    are reused by every larger multiset that contains them.
+    """
+
+    def __init__(self, shared_size=SHARED_SIZE):
+        self.shared_size = shared_size
+        self.__shared = {}
+
+    def __exact(self, key, local):
+        """Returns the values that can be made from the sorted tuple
+        {key}, using every number in it. Multisets that are too large
+        to share are kept in {local}, which lives for one deal."""
+        cache = self.__shared if len(key) <= self.shared_size else local
+        values = cache.get(key)
+        if values is not None:
+            return values
+
+        if len(key) == 1:
+            values = frozenset(key)
+        else:
+            result = set()
+            add = result.add
+            # The first number is always in the left part, so every
+            # split is seen once
+            first, rest = key[0], key[1:]
+            tried = set()
+            for size in range(len(rest)):
+                for others in itertools.combinations(rest, size):
+                    if others in tried:
+                        continue
+                    tried.add(others)
+                    complement = list(rest)
+                    for number in others:
+                        complement.remove(number)
+                    right_values = self.__exact(tuple(complement), local)
+                    for left in self.__exact((first,) + others, local):
+                        for right in right_values:
+                            a, b = (left, right) if left >= right else (right, left)
+                            add(a + b)
+                            if a > b:
+                                add(a - b)
+                            if b != 1:
+                                add(a * b)
+                                if a % b == 0:
+                                    add(a // b)
+            values = frozenset(result)
+        cache[key] = values
+        return values
+
+    def reachable(self, numbers):
+        """Returns the set of all values that can be made from the given
+        numbers, each used at most once. This gives the same result as
+        solver.reachable()."""
+        local = {}
+        values = set()
+        tried = set()
+        numbers = tuple(sorted(numbers))
+        for size in range(1, len(numbers) + 1):
+            for key in itertools.combinations(numbers, size):
+                if key not in tried:
+                    tried.add(key)
+                    values |= self.__exact(key, local)
+        return values
+
+
+_cache = ValueCache()
+
+
+def distances(deal, lowest=LOWEST_TARGET, highest=HIGHEST_TARGET):
+    """Returns an array with the distance from every target from
+    {lowest} to {highest} to the closest value that can be made with
+    {deal}; 0 means the target can be reached exactly."""
+    values = sorted(_cache.reachable(deal))
+    result = array.array('H')
+    i = 0
+    for target in range(lowest, highest + 1):
+        while i < len(values) and values[i] < target:
+            i += 1
+        closest = values[i] - target if i < len(values) else math.inf
+        if i:
+            closest = min(closest, target - values[i - 1])
+        result.append(closest)
+    return result
+
+
+def statistics(numbers, total=6, lowest=LOWEST_TARGET, highest=HIGHEST_TARGET, workers=None):
+    """Computes the statistics for every option of the radio group.
+    Returns a dict that maps the number of big numbers to a pair of
+    lists (solvable, mean_distance), with one entry per target from
+    {lowest} to {highest}: the probability that the target can be made
+    exactly, and the expected distance to the closest result. The deals
+    are solved by {workers} processes (one per CPU by default).
+    """
+    options = {big: option_deals(numbers, big, total)
+               for big in range(min(len(numbers['big']), total) + 1)
+               if total - big <= len(numbers['small'])}
+    # Sorted, so that the deals in a chunk share most of their parts
+    all_deals = sorted(set().union(*options.values()))
+    width = highest - lowest + 1
+    result = {big: ([0.0] * width, [0.0] * width) for big in options}
+
+    start = time.perf_counter()
+    jobs = ((deal, lowest, highest) for deal in all_deals)
+    for number, deal_distances in enumerate(parallel_map(distances, jobs, workers, chunksize=64)):
+        deal = all_deals[number]
+        for big, weights in options.items():
+            weight = weights.get(deal)
+            if weight is None:
+                continue
+            solvable, mean_distance = result[big]
+            for t, distance in enumerate(deal_distances):
+                if distance == 0:
+                    solvable[t] += weight
+                else:
+                    mean_distance[t] += weight * distance
+        if number % 1000 == 0:
+            logger.info('Solved %d of %d deals in %.0fs',
+                        number, len(all_deals), time.perf_counter() - start)
+    return result
+
+
+def write_csv(result, path, lowest=LOWEST_TARGET):
+    """Writes the result of statistics() to {path} as CSV, with the
+    columns big, target, solvable and mean_distance."""
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['big', 'target', 'solvable', 'mean_distance'])
+        for big in sorted(result, reverse=True):
+            solvable, mean_distance = result[big]
+            for t in range(len(solvable)):
+                writer.writerow([big, lowest + t, f'{solvable[t]:.6f}', f'{mean_distance[t]:.4f}'])
+
+
+def main():
+    from main import CountdownGui
+
+    parser = argparse.ArgumentParser(description='Solvability statistics per number of big numbers')
+    parser.add_argument('--output', default='solvability.csv', help='the CSV file to write')
+    parser.add_argument('--workers', type=int, help='the number of processes (one per CPU by default)')
+    args = parser.parse_args()
+
+    logging.basicConfig()
+    result = statistics(CountdownGui.NUMBERS, workers=args.workers)
+    write_csv(result, args.output)
+    for big in sorted(result, reverse=True):
+        solvable, mean_distance = result[big]
+        logger.info('%d big: %.1f%% of the targets solvable, mean distance %.2f',
+                    big, 100 * sum(solvable) / len(solvable), sum(mean_distance) / len(mean_distance))
+    logger.info('Wrote %s', args.output)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,365 @@
+"""Solver for the Numbers game of Countdown / Letters and Numbers.
+
+Given a selection of numbers (usually the six tiles dealt by
+CountdownGui.get_random_selection) and a target, the solver searches
+for an arithmetic expression that reaches the target exactly. If the
+target cannot be reached, the closest reachable result is returned.
+
+The rules are the ones used on the show: +, -, * and / may be used,
+every number may be used at most once, and all intermediate results
+must be positive integers.
+
+The search prunes aggressively:
+
+- each unordered pair of numbers is combined only once, so the
+  commutative duplicates a + b / b + a and a * b / b * a are skipped;
+- multiplying or dividing by 1 is skipped, as it never creates a
+  new value;
+- subtraction is only tried as larger - smaller, so there are never
+  negative (or zero) intermediate results;
+- division is only tried when it leaves no remainder;
+- a - b == b and a / b == b are skipped, as they give back a number
+  that was already available;
+- the values of a multiset of numbers are found once: the values that
+  use all of it are built from the values of every way to split it in
+  two, and the multisets are shared by all the larger ones that
+  contain them.
+
+The values of a deal are kept in a table, so solving the same deal
+for another target is a lookup instead of a new search.
+
+For batch work, such as re-solving millions of deals, solve_many()
+spreads the jobs over a pool of worker processes.
+"""
+import bisect
+import collections
+import functools
+import itertools
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+
+class Solution:
+    """The result of a search: the value reached, the expression
+    that reaches it and its distance to the target."""
+
+    def __init__(self, value, expression, target):
+        self.value = value
+        self.expression = expression
+        self.target = target
+
+    @property
+    def distance(self):
+        """The absolute difference between the value and the target."""
+        return abs(self.target - self.value)
+
+    @property
+    def exact(self):
+        """True if the value is the target."""
+        return self.value == self.target
+
+    def __repr__(self):
+        return f'Solution({self.expression} = {self.value}, target={self.target})'
+
+
+def combine(a, b):
+    """Yields (value, operator) for every useful way to combine the
+    numbers a and b, where a >= b. The pruning rules are described
+    in the module docstring.
+    """
+    yield a + b, '+'
+    if a > b and a - b != b:
+        yield a - b, '-'
+    if b != 1:
+        yield a * b, '*'
+        if a % b == 0 and a // b != b:
+            yield a // b, '/'
+
+
+def format_expression(expression, top=True):
+    """Formats an expression tree as a string. A tree is either a
+    number or a tuple (left, operator, right); sub-expressions are
+    put between parentheses.
+    """
+    if not isinstance(expression, tuple):
+        return str(expression)
+    left, op, right = expression
+    text = f'{format_expression(left, False)} {op} {format_expression(right, False)}'
+    return text if top else f'({text})'
+
+
+CACHED_DEALS = 16  # The number of deals whose value tables are kept
+
+
+@functools.lru_cache(maxsize=CACHED_DEALS)
+def _value_table(numbers):
+    """Returns a pair (values, table) for the sorted tuple {numbers}:
+    the sorted list of every value that can be made from them, and a
+    _ValueTable that gives an expression for each of them.
+    """
+    table = _ValueTable(numbers)
+    return sorted(table.keys), table
+
+
+class _ValueTable:
+    """The values that can be made from a multiset of numbers, built
+    bottom-up: the values that use all of a multiset come from the
+    values of every way to split it in two, so each multiset is
+    combined once. Only numbers and tuples of numbers are stored, which
+    the garbage collector does not have to scan, and the expression of
+    a value is rebuilt from them when it is asked for."""
+
+    def __init__(self, numbers):
+        # For every multiset that has been combined, a dict that maps
+        # the values that use all of it to how they were made:
+        # (left multiset, left value, operator, right multiset, right
+        # value), or None for a single number
+        self.exact = {}
+        # The smallest multiset that makes each value
+        self.keys = {}
+        for size in range(1, len(numbers) + 1):
+            for key in dict.fromkeys(itertools.combinations(numbers, size)):
+                for value in self.exact_values(key):
+                    if value not in self.keys:
+                        self.keys[value] = key
+
+    def exact_values(self, key):
+        """Returns the dict of the values that use every number of the
+        sorted tuple {key}."""
+        result = self.exact.get(key)
+        if result is not None:
+            return result
+        if len(key) == 1:
+            result = {key[0]: None}
+        else:
+            result = {}
+            # The first number is always in the left part, so every
+            # split is seen once
+            first, rest = key[0], key[1:]
+            tried = set()
+            for size in range(len(rest)):
+                for others in itertools.combinations(rest, size):
+                    if others in tried:
+                        continue
+                    tried.add(others)
+                    complement = list(rest)
+                    for number in others:
+                        complement.remove(number)
+                    left_key, right_key = (first,) + others, tuple(complement)
+                    right_values = self.exact_values(right_key)
+                    for left in self.exact_values(left_key):
+                        for right in right_values:
+                            # Inlined combine(), this is the hot loop
+                            if left >= right:
+                                a, b, ka, kb = left, right, left_key, right_key
+                            else:
+                                a, b, ka, kb = right, left, right_key, left_key
+                            value = a + b
+                            if value not in result:
+                                result[value] = (ka, a, '+', kb, b)
+                            value = a - b
+                            if value > 0 and value != b and value not in result:
+                                result[value] = (ka, a, '-', kb, b)
+                            if b != 1:
+                                value = a * b
+                                if value not in result:
+                                    result[value] = (ka, a, '*', kb, b)
+                                if a % b == 0:
+                                    value = a // b
+                                    if value != b and value not in result:
+                                        result[value] = (ka, a, '/', kb, b)
+        self.exact[key] = result
+        return result
+
+    def expression(self, value, key=None):
+        """Returns an expression tree that makes {value} from the
+        multiset {key}, or from the smallest one that can make it."""
+        if key is None:
+            key = self.keys[value]
+        made = self.exact[key][value]
+        if made is None:
+            return value
+        left_key, left, op, right_key, right = made
+        return (self.expression(left, left_key), op, self.expression(right, right_key))
+
+
+def solve(numbers, target):
+    """Finds an expression that reaches {target} using the given
+    numbers, each at most once. Returns a Solution. If the target
+    cannot be reached, the Solution holds the closest result.
+
+    The first call for a deal builds its value table, which takes
+    about 20 ms for six tiles, and up to about 50 ms. The tables of the
+    last CACHED_DEALS deals are kept, so any other target with the same
+    numbers is a lookup of a few microseconds.
+    """
+    numbers = tuple(numbers)
+    if not numbers:
+        raise ValueError('At least one number is required')
+
+    values, table = _value_table(tuple(sorted(numbers)))
+    i = bisect.bisect_left(values, target)
+    best = min(values[max(0, i - 1):i + 1], key=lambda value: abs(target - value))
+    return Solution(best, format_expression(table.expression(best)), target)
+
+
+def solutions(numbers, target, stop=None, first=None):
+    """Yields the distinct expressions that reach {target} exactly with
+    the given numbers, as strings. The first one comes from solve(),
+    which is usually fast. After that, expressions that use fewer
+    numbers come first, while the full enumeration can take a few
+    seconds. The search ends early once the threading.Event {stop}
+    is set.
+
+    If {first} is given, it is called with the Solution from solve(),
+    so the caller gets the closest result without searching again.
+    solve() searches everything, so when that Solution is not exact
+    there are no solutions and nothing is yielded.
+    """
+    numbers = tuple(numbers)
+    found = set()
+
+    def visit(values, expressions, depth):
+        """Yields the solutions that take exactly {depth} more
+        combinations of {values}."""
+        if stop is not None and stop.is_set():
+            return
+        n = len(values)
+        tried = set()
+        for i in range(n - 1):
+            for j in range(i + 1, n):
+                a, b = values[i], values[j]
+                ea, eb = expressions[i], expressions[j]
+                if a < b:
+                    a, b, ea, eb = b, a, eb, ea
+                if (a, b) in tried:
+                    continue
+                tried.add((a, b))
+
+                rest = values[:i] + values[i + 1:j] + values[j + 1:]
+                rest_expressions = expressions[:i] + expressions[i + 1:j] + expressions[j + 1:]
+                for value, op in combine(a, b):
+                    expression = (ea, op, eb)
+                    if depth == 1:
+                        if value == target:
+                            text = format_expression(expression)
+                            if text not in found:
+                                found.add(text)
+                                yield text
+                    elif rest:
+                        yield from visit(rest + (value,), rest_expressions + (expression,), depth - 1)
+
+    solution = solve(numbers, target)
+    if first is not None:
+        first(solution)
+    if not solution.exact:
+        return
+    found.add(solution.expression)
+    yield solution.expression
+    # Iterative deepening: first all solutions with one operation,
+    # then with two, and so on
+    for depth in range(1, len(numbers)):
+        yield from visit(numbers, numbers, depth)
+
+
+class SolutionStream:
+    """Runs solutions() in a background thread. The expressions are
+    collected in a queue, so a GUI can take them in batches with take()
+    without waiting for the search.
+    """
+
+    def __init__(self, numbers, target):
+        self.numbers = tuple(numbers)
+        self.target = target
+        self.closest = None  # The closest Solution if there is no exact one
+        self.finished = False
+        self.__queue = queue.SimpleQueue()
+        self.__stop = threading.Event()
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def __run(self):
+        try:
+            for expression in solutions(self.numbers, self.target, self.__stop, self.__first):
+                self.__queue.put(expression)
+        finally:
+            self.finished = True
+
+    def __first(self, solution):
+        """Keeps the first Solution as the closest one if it is not
+        exact."""
+        if not solution.exact:
+            self.closest = solution
+
+    def take(self):
+        """Returns the expressions found since the last call."""
+        batch = []
+        while True:
+            try:
+                batch.append(self.__queue.get_nowait())
+            except queue.Empty:
+                return batch
+
+    def cancel(self):
+        """Stops the search. The thread ends soon after."""
+        self.__stop.set()
+
+
+def reachable(numbers):
+    """Returns the set of all values that can be made from the given
+    numbers, each used at most once. This is the value table of
+    solve(), without the expressions.
+    """
+    return set(_value_table(tuple(sorted(numbers)))[0])
+
+
+def _apply_chunk(function, chunk):
+    """Runs {function} on every job in {chunk}. This runs in a worker
+    process, so a whole chunk costs only one round trip."""
+    return [function(*job) for job in chunk]
+
+
+def parallel_map(function, jobs, workers=None, chunksize=256):
+    """Yields function(*job) for every job in the iterable {jobs}, in
+    order. The jobs are sent in chunks of {chunksize} to a pool of
+    {workers} processes (one per CPU by default). Only a few chunks per
+    worker are in flight at any time, so {jobs} may be a generator of
+    any length. {function} must be defined at module level so it can
+    be sent to the workers.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    jobs = iter(jobs)
+    if workers == 1:
+        for job in jobs:
+            yield function(*job)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=workers)
+    pending = collections.deque()
+
+    def submit():
+        chunk = list(itertools.islice(jobs, chunksize))
+        if chunk:
+            pending.append(executor.submit(_apply_chunk, function, chunk))
+
+    try:
+        # Keep every worker busy while the oldest chunk is collected
+        for _ in range(2 * workers):
+            submit()
+        while pending:
+            results = pending.popleft().result()
+            submit()
+            yield from results
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def solve_many(jobs, workers=None, chunksize=256):
+    """Solves every (numbers, target) job in the iterable {jobs} with
+    solve(), using a pool of worker processes. Yields the Solutions in
+    the order of the jobs. See parallel_map() for the parameters.
+    """
+    return parallel_map(solve, jobs, workers, chunksize)
@@ -0,0 +1,52 @@
+"""Checks the conundrum index and the scrambling of its words."""
+import random
+
+import pytest
+
+from conundrum import ConundrumIndex, build_index, scramble, unique_words
+
+WORDS = ['crocodile', 'pineapple', 'education', 'auctioned', 'cautioned',
+         'astronaut', 'chocolate', 'tarantula', 'short', 'blueberries']
+UNIQUE = ['astronaut', 'chocolate', 'crocodile', 'pineapple', 'tarantula']
+
+
+def test_unique_words():
+    assert unique_words(WORDS) == UNIQUE
+
+
+@pytest.fixture(scope='module')
+def index(built_index):
+    count, index = built_index(build_index, ConundrumIndex, WORDS)
+    assert count == len(UNIQUE)
+    return index
+
+
+def test_lookup(index):
+    assert len(index) == len(UNIQUE)
+    assert [index[number] for number in range(len(index))] == UNIQUE
+    with pytest.raises(IndexError):
+        index[len(UNIQUE)]
+
+
+def test_pick(index):
+    rng = random.Random(3)
+    for _ in range(20):
+        scrambled, answer = index.pick(rng)
+        assert answer in UNIQUE
+        assert scrambled != answer and sorted(scrambled) == sorted(answer)
+
+
+def test_scramble_of_one_letter():
+    assert scramble('aaaaaaaaa') == 'aaaaaaaaa'
+
+
+def test_no_puzzles(tmp_path):
+    with pytest.raises(ValueError):
+        build_index(['education', 'auctioned'], str(tmp_path / 'conundrum.idx'))
+
+
+def test_not_an_index(tmp_path):
+    path = tmp_path / 'other.idx'
+    path.write_bytes(b'CDCN')
+    with pytest.raises(ValueError):
+        ConundrumIndex(str(path))
@@ -0,0 +1,60 @@
+"""Checks the word index of the Letters round against a plain scan."""
+import collections
+import random
+
+import pytest
+
+from letters import WordIndex, allowed_kinds, build_index, draw_letter, read_words
+
+WORDS = ['stare', 'tears', 'rates', 'aster', 'star', 'rats', 'arts', 'tar',
+         'rat', 'art', 'at', 'ta', 'treats', 'streamed', 'master', 'stream',
+         'tamers', 'mate', 'meat', 'team', 'tame', 'dreams', 'zebra', 'ox']
+
+
+def can_make(word, tiles):
+    return not collections.Counter(word) - collections.Counter(tiles)
+
+
+@pytest.fixture(scope='module')
+def index(built_index):
+    count, index = built_index(build_index, WordIndex, WORDS)
+    assert count == len({''.join(sorted(word)) for word in WORDS})
+    return index
+
+
+def test_anagrams(index):
+    assert sorted(index.anagrams('RESTA')) == ['aster', 'rates', 'stare', 'tears']
+    assert index.anagrams('ox') == ['ox']
+    assert index.anagrams('qqq') == []
+    assert index.key_count == len({''.join(sorted(word)) for word in WORDS})
+    assert index.word_count == len(WORDS)
+
+
+@pytest.mark.parametrize('tiles', ['STREAMEDX', 'MASTERZOB', 'TARQQQQQQ', 'QQQQQQQQQ'])
+def test_solve_matches_scan(index, tiles):
+    count = 3
+    tiles = tiles.lower()
+    playable = sorted((word for word in WORDS if can_make(word, tiles)),
+                      key=lambda word: (-len(word), word))
+    expected = []
+    for length in sorted({len(word) for word in playable}, reverse=True):
+        expected.extend(word for word in playable if len(word) == length)
+        if len(expected) >= count:
+            break
+    assert index.solve(tiles, count) == expected
+
+
+def test_read_words(tmp_path):
+    path = tmp_path / 'words'
+    path.write_text('Paris\nstare\nstare\nNASA\na\ncan\'t\ncafé\ntoolongword\nox\n')
+    assert read_words(str(path)) == {'stare', 'ox'}
+    assert read_words(str(path), proper_nouns=True) == {'paris', 'stare', 'nasa', 'ox'}
+
+
+def test_tiles():
+    rng = random.Random(1)
+    tiles = []
+    while allowed_kinds(tiles):
+        tiles.append(draw_letter(rng.choice(allowed_kinds(tiles)), rng))
+    vowels = sum(1 for tile in tiles if tile in 'AEIOU')
+    assert len(tiles) == 9 and vowels >= 3 and len(tiles) - vowels >= 4
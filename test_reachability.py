@@ -0,0 +1,43 @@
+"""Checks that a reachability index gives back what was put in it."""
+import pytest
+
+from reachability import ReachabilityIndex, build_index, deals
+from solver import reachable
+
+NUMBERS = {'small': [1, 1, 2, 2, 3, 3, 4], 'big': [25, 50]}
+
+
+@pytest.fixture(scope='module')
+def index(built_index):
+    count, index = built_index(build_index, ReachabilityIndex, NUMBERS, workers=1)
+    assert count == len(list(deals(NUMBERS)))
+    return index
+
+
+def test_round_trip(index):
+    assert index.deal_count == len(list(deals(NUMBERS)))
+    for deal in deals(NUMBERS):
+        expected = sorted(value for value in reachable(deal)
+                          if index.lowest <= value <= index.highest)
+        assert index.solvable_targets(deal) == expected
+        for target in (index.lowest, 150, index.highest):
+            assert index.is_solvable(deal, target) == (target in expected)
+
+
+def test_unknown_deal(index):
+    with pytest.raises(KeyError):
+        index.solvable_targets((75, 1, 2, 3, 4, 25))
+    with pytest.raises(KeyError):
+        index.solvable_targets((4, 4, 1, 2, 3, 25))
+
+
+def test_target_out_of_range(index):
+    with pytest.raises(ValueError):
+        index.is_solvable((1, 1, 2, 2, 3, 3), index.highest + 1)
+
+
+def test_not_an_index(tmp_path):
+    path = tmp_path / 'other.idx'
+    path.write_bytes(b'\0' * 64)
+    with pytest.raises(ValueError):
+        ReachabilityIndex(str(path))
@@ -0,0 +1,45 @@
+"""Checks that rounds appended to a round log are read back intact."""
+import pytest
+
+from roundlog import HEADER, RECORD, Round, RoundLog, read_rounds
+
+ROUNDS = [
+    Round(2 ** 64 - 1, 0, 2, (100, 25, 1, 5, 7, 9), 952, 1.5, 1750.25),
+    Round(12345, 1, 0, (1, 1, 2, 3, 8, 10), 100, 0.0, 0.5),
+    Round(0, 3, 4, (25, 50, 75, 100, 6, 3), 999, 2.75, 1600.0),
+]
+
+
+def write(path, rounds):
+    log = RoundLog(path)
+    for round_ in rounds:
+        log.append(round_)
+    log.close()
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / 'rounds.log')
+    write(path, ROUNDS[:2])
+    write(path, ROUNDS[2:])
+    assert list(read_rounds(path)) == ROUNDS
+
+
+def test_partial_record_is_dropped(tmp_path):
+    path = tmp_path / 'rounds.log'
+    write(str(path), ROUNDS[:1])
+    with open(path, 'ab') as f:
+        f.write(b'\1\2')
+    assert list(read_rounds(str(path))) == ROUNDS[:1]
+
+    write(str(path), ROUNDS[1:])
+    assert list(read_rounds(str(path))) == ROUNDS
+    assert path.stat().st_size == HEADER.size + len(ROUNDS) * RECORD.size
+
+
+def test_not_a_round_log(tmp_path):
+    path = tmp_path / 'other.log'
+    path.write_bytes(b'not a log')
+    with pytest.raises(ValueError):
+        RoundLog(str(path))
+    with pytest.raises(ValueError):
+        list(read_rounds(str(path)))
@@ -0,0 +1,55 @@
+"""Checks the bulk round generator against the rules of the deal."""
+import collections
+
+import pytest
+
+np = pytest.importorskip('numpy')
+
+from rounds import deal_rounds
+from rules import HIGHEST_TARGET, LOWEST_TARGET
+
+NUMBERS = {
+    'small': [1, 1, 2, 2, 3, 3, 4, 4, 5, 5, 6, 6, 7, 7, 8, 8, 9, 9, 10, 10],
+    'big': [25, 50, 75, 100],
+}
+
+
+def test_same_seed_same_arrays():
+    first = deal_rounds(2000, seed=42, numbers=NUMBERS)
+    second = deal_rounds(2000, seed=42, numbers=NUMBERS)
+    for a, b in zip(first, second):
+        assert a.dtype == b.dtype == np.int16
+        assert a.tobytes() == b.tobytes()
+    other = deal_rounds(2000, seed=43, numbers=NUMBERS)
+    assert first[0].tobytes() != other[0].tobytes()
+
+
+def test_pool_limits():
+    deals, targets = deal_rounds(5000, seed=1, numbers=NUMBERS)
+    assert deals.shape == (5000, 6) and targets.shape == (5000,)
+    assert targets.min() >= LOWEST_TARGET and targets.max() <= HIGHEST_TARGET
+    limits = collections.Counter(NUMBERS['small'] + NUMBERS['big'])
+    for deal in deals.tolist():
+        counts = collections.Counter(deal)
+        assert all(counts[tile] <= limits[tile] for tile in counts)
+        big = sum(1 for tile in deal if tile in NUMBERS['big'])
+        # The big numbers come first
+        assert all(tile in NUMBERS['big'] for tile in deal[:big])
+
+
+@pytest.mark.parametrize('big', [0, 2, 4])
+def test_number_of_big_numbers(big):
+    deals, _ = deal_rounds(500, big=big, seed=7, numbers=NUMBERS)
+    assert (np.isin(deals, NUMBERS['big']).sum(axis=1) == big).all()
+
+
+def test_big_per_round():
+    big = np.arange(500) % 5
+    deals, _ = deal_rounds(500, big=big, seed=7, numbers=NUMBERS)
+    assert (np.isin(deals, NUMBERS['big']).sum(axis=1) == big).all()
+
+
+@pytest.mark.parametrize('big', [-1, 5, [0, 1, 6]])
+def test_bad_big_raises(big):
+    with pytest.raises(ValueError):
+        deal_rounds(3, big=big, seed=0, numbers=NUMBERS)
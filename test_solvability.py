@@ -0,0 +1,41 @@
+"""Checks the solvability statistics against the solver."""
+import math
+
+import pytest
+
+import solver
+from solvability import ValueCache, distances, option_deals
+
+DEALS = [
+    (100, 75, 50, 25, 6, 3),
+    (1, 1, 2, 2, 3, 3),
+    (50, 10, 9, 7, 5, 5),
+    (100, 10, 10, 9, 1, 1),
+    (25, 8, 4, 1),
+]
+
+NUMBERS = {'small': [1, 1, 2, 2, 3, 3, 4, 4], 'big': [25, 50, 75]}
+
+
+def test_reachable_matches_solver():
+    # One cache for all the deals, as the shared parts are reused
+    cache = ValueCache()
+    for deal in DEALS:
+        assert cache.reachable(deal) == solver.reachable(deal)
+
+
+@pytest.mark.parametrize('deal', DEALS[:3])
+def test_distances(deal):
+    values = solver.reachable(deal)
+    result = distances(deal, 100, 199)
+    for target, distance in zip(range(100, 200), result):
+        assert distance == min(abs(target - value) for value in values)
+
+
+@pytest.mark.parametrize('big', range(4))
+def test_option_deals_are_probabilities(big):
+    deals = option_deals(NUMBERS, big)
+    assert math.isclose(sum(deals.values()), 1.0)
+    for deal in deals:
+        assert len(deal) == 6 and list(deal) == sorted(deal)
+        assert sum(1 for tile in deal if tile in NUMBERS['big']) == big
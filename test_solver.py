@@ -0,0 +1,75 @@
+"""Checks the solver against a brute-force search without pruning."""
+import collections
+import functools
+import re
+
+import pytest
+
+from solver import reachable, solutions, solve
+
+DEALS = [
+    (100, 75, 50, 25, 6, 3),
+    (1, 1, 2, 2, 3, 3),
+    (50, 10, 9, 7, 5, 5),
+    (25, 8, 4, 1),
+    (7, 7),
+]
+
+
+@functools.lru_cache(maxsize=None)
+def brute_force(numbers):
+    """Returns every value that can be made from the sorted tuple
+    {numbers}, with all four operators in every order."""
+    values = set(numbers)
+    for i in range(len(numbers)):
+        for j in range(len(numbers)):
+            if i == j:
+                continue
+            a, b = numbers[i], numbers[j]
+            rest = [n for k, n in enumerate(numbers) if k not in (i, j)]
+            results = [a + b, a * b]
+            if a > b:
+                results.append(a - b)
+            if a % b == 0:
+                results.append(a // b)
+            for value in results:
+                values |= brute_force(tuple(sorted(rest + [value])))
+    return frozenset(values)
+
+
+def check_expression(expression, numbers, value):
+    """Asserts that {expression} evaluates to {value} and uses each of
+    {numbers} at most as often as it was dealt."""
+    used = collections.Counter(int(n) for n in re.findall(r'\d+', expression))
+    assert not used - collections.Counter(numbers)
+    assert eval(expression.replace('/', '//')) == value
+
+
+@pytest.mark.parametrize('numbers', DEALS)
+def test_reachable_matches_brute_force(numbers):
+    assert reachable(numbers) == brute_force(tuple(sorted(numbers)))
+
+
+@pytest.mark.parametrize('numbers', DEALS)
+def test_solve_finds_the_closest_value(numbers):
+    values = brute_force(tuple(sorted(numbers)))
+    for target in (101, 347, 500, 813, 952, 999):
+        solution = solve(numbers, target)
+        assert solution.exact == (target in values)
+        assert solution.distance == min(abs(target - value) for value in values)
+        check_expression(solution.expression, numbers, solution.value)
+
+
+def test_solutions_reach_the_target():
+    numbers, target = (100, 75, 50, 25, 6, 3), 952
+    found = list(solutions(numbers, target))
+    assert found and len(found) == len(set(found))
+    for expression in found:
+        check_expression(expression, numbers, target)
+
+
+def test_solutions_reports_the_closest_value():
+    numbers, target = (1, 1, 2, 2, 3, 3), 999
+    first = []
+    assert list(solutions(numbers, target, first=first.append)) == []
+    assert first[0].value == max(brute_force(tuple(sorted(numbers))))